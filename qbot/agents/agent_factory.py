@@ -4,10 +4,10 @@ import importlib
 import re
 from typing import Any, Dict, List, Optional, Type
 
-from src.configs.agents import AgentConfig
-from src.toolkits import FunctionTool
-from src.toolkits.utils import convert_to_function_tool
-from src.models import ModelFactory
+from qbot.configs.agents import AgentConfig
+from qbot.toolkits import FunctionTool
+from qbot.toolkits.utils import convert_to_function_tool
+from qbot.models import ModelFactory
 
 AGENT_CLASS_REGISTRY: Dict[str, str] = {
     "chat": "src.agents.chat_agent:ChatAgent",
@@ -45,7 +45,7 @@ def _load_class(path_or_name: str) -> Type:
     # C) 'ClassName' — resolve in 'src.toolkits' namespace
     class_name = path_or_name
 
-    # Try re-export from src.toolkits/__init__.py
+    # Try re-export from qbot.toolkits/__init__.py
     try:
         mod = importlib.import_module("src.toolkits")
         return getattr(mod, class_name)
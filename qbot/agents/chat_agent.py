@@ -11,17 +11,17 @@ import time
 import uuid
 from pydantic import BaseModel, ValidationError
 from pathlib import Path
-from src.agents import BaseAgent
+from qbot.agents import BaseAgent
 
-from src.models import (
+from qbot.models import (
     BaseModelBackend
 )
 
-from src.toolkits import (
+from qbot.toolkits import (
     FunctionTool
 )
 
-from src.toolkits.utils import(
+from qbot.toolkits.utils import(
     convert_to_schema,
     convert_to_function_tool,
     handle_logprobs,
@@ -29,12 +29,12 @@ from src.toolkits.utils import(
     get_info_dict
 )
 
-from src.types import (
+from qbot.types import (
     RoleType,
     OpenAIBackendRole,
 )
 
-from src.messages import (
+from qbot.messages import (
     BaseMessage,
     OpenAIMessage,
     ModelResponse,
@@ -44,7 +44,7 @@ from src.messages import (
     FunctionCallingMessage
 )
 
-from src.memories import (
+from qbot.memories import (
     ChatHistoryMemory,
     AgentMemory,
     ScoreBasedContextCreator,
@@ -52,9 +52,9 @@ from src.memories import (
     ToolCallingRecord
 )
 
-from src.memories.storages import JsonStorage
+from qbot.memories.storages import JsonStorage
 
-from src.prompts import TextPrompt
+from qbot.prompts import TextPrompt
 
 SIMPLE_FORMAT_PROMPT = TextPrompt(
     textwrap.dedent(
@@ -8,17 +8,17 @@ from typing import Dict, List, Any, Optional, Tuple, Callable, Union, Set, Type,
 from loguru import logger
 from pydantic import BaseModel
 from pathlib import Path
-from src.agents.chat_agent import ChatAgent
+from qbot.agents.chat_agent import ChatAgent
 
-from src.models import (
+from qbot.models import (
     BaseModelBackend
 )
 
-from src.toolkits import (
+from qbot.toolkits import (
     FunctionTool
 )
 
-from src.toolkits.utils import(
+from qbot.toolkits.utils import(
     convert_to_schema,
     convert_to_function_tool,
     handle_logprobs,
@@ -27,12 +27,12 @@ from src.toolkits.utils import(
     extract_tool_calls_and_clean,
 )
 
-from src.types import(
+from qbot.types import(
     RoleType,
     OpenAIBackendRole,
 )
 
-from src.messages import (
+from qbot.messages import (
     BaseMessage,
     OpenAIMessage,
     ModelResponse,
@@ -41,7 +41,7 @@ from src.messages import (
     FunctionCallingMessage
 )
 
-from src.memories import (
+from qbot.memories import (
     ChatHistoryMemory,
     AgentMemory,
     ScoreBasedContextCreator,
@@ -49,7 +49,7 @@ from src.memories import (
     ToolCallingRecord
 )
 
-from src.memories.storages import JsonStorage
+from qbot.memories.storages import JsonStorage
 
 class DeepResearchAgent(ChatAgent):
     def __init__(
@@ -10,7 +10,7 @@ class AgentConfig():
     """
     Serializable config for building an Agent.
     """
-    from src.types.enums import ModelPlatformType, ModelType
+    from qbot.types.enums import ModelPlatformType, ModelType
     PlatformEnum: ClassVar[type[ModelPlatformType]] = ModelPlatformType
     ModelEnum: ClassVar[type[ModelType]] = ModelType
     # Choose one of the two built-in agents
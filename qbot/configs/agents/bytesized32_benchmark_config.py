@@ -1,6 +1,6 @@
 # src/configs/agents/deep_research_agent_config.py
 from dataclasses import dataclass, field
-from src.configs.agents.base_config import AgentConfig
+from qbot.configs.agents.base_config import AgentConfig
 
 @dataclass
 class Bytesized32Config(AgentConfig):
@@ -9,7 +9,7 @@ class Bytesized32Config(AgentConfig):
 
     @classmethod
     def default(cls) -> "Bytesized32Config":
-        from src.prompts import DeepResearchPromptTemplateDict
+        from qbot.prompts import DeepResearchPromptTemplateDict
         # You can pass *string values*; Pydantic will coerce them to enums,
         # or you can import the enums here and pass the enum members explicitly.
         return cls(
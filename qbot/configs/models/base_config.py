@@ -39,7 +39,7 @@ class BaseConfig(ABC, BaseModel):
         `FunctionTool`, it raises a ValueError.
         """
         if tools is not None:
-            from src.toolkits import FunctionTool
+            from qbot.toolkits import FunctionTool
 
             for tool in tools:
                 if not isinstance(tool, FunctionTool):
@@ -5,7 +5,7 @@ from typing import Dict, Optional, Sequence, Type, Union
 
 from pydantic import BaseModel, Field
 
-from src.configs.models.base_config import BaseConfig
+from qbot.configs.models.base_config import BaseConfig
 
 
 class ChatGPTConfig(BaseConfig):
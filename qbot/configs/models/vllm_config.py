@@ -5,7 +5,7 @@ from typing import Optional, Sequence, Union
 
 from pydantic import Field
 
-from src.configs.models.base_config import BaseConfig
+from qbot.configs.models.base_config import BaseConfig
 
 
 class _NotGivenType:
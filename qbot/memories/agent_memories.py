@@ -2,10 +2,10 @@ import json
 import warnings
 from typing import List, Optional,Any
 
-from src.memories.base import AgentMemory, BaseContextCreator
-from src.memories.blocks import ChatHistoryBlock, VectorDBBlock
-from src.memories.records import ContextRecord, MemoryRecord
-from src.types import OpenAIBackendRole
+from qbot.memories.base import AgentMemory, BaseContextCreator
+from qbot.memories.blocks import ChatHistoryBlock, VectorDBBlock
+from qbot.memories.records import ContextRecord, MemoryRecord
+from qbot.types import OpenAIBackendRole
 
 
 class ChatHistoryMemory(AgentMemory):
@@ -1,9 +1,9 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional, Tuple
 import json 
-from src.memories.records import ContextRecord, MemoryRecord
-from src.messages import OpenAIMessage
-from src.models import BaseTokenCounter
+from qbot.memories.records import ContextRecord, MemoryRecord
+from qbot.messages import OpenAIMessage
+from qbot.models import BaseTokenCounter
 
 
 class MemoryBlock(ABC):
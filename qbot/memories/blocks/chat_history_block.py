@@ -1,12 +1,12 @@
 import warnings
 from typing import List, Optional
 
-from src.memories.base import MemoryBlock
-from src.memories.records import ContextRecord, MemoryRecord
+from qbot.memories.base import MemoryBlock
+from qbot.memories.records import ContextRecord, MemoryRecord
 
-from src.types import OpenAIBackendRole
-from src.memories.storages.base import BaseKeyValueStorage
-from src.memories.storages.in_memory import InMemoryKeyValueStorage
+from qbot.types import OpenAIBackendRole
+from qbot.memories.storages.base import BaseKeyValueStorage
+from qbot.memories.storages.in_memory import InMemoryKeyValueStorage
 
 
 class ChatHistoryBlock(MemoryBlock):
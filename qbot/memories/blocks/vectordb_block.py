@@ -7,8 +7,8 @@ import hashlib
 import math
 import os
 
-from src.memories.base import MemoryBlock
-from src.memories.records import ContextRecord, MemoryRecord
+from qbot.memories.base import MemoryBlock
+from qbot.memories.records import ContextRecord, MemoryRecord
 
 
 class BaseEmbedding:
@@ -3,10 +3,10 @@ from typing import List, Tuple
 from pydantic import BaseModel
 
 from loguru import logger
-from src.memories import BaseContextCreator
-from src.memories.records import ContextRecord
-from src.messages import OpenAIMessage
-from src.models import BaseTokenCounter
+from qbot.memories import BaseContextCreator
+from qbot.memories.records import ContextRecord
+from qbot.messages import OpenAIMessage
+from qbot.models import BaseTokenCounter
 
 
 class _ContextUnit(BaseModel):
@@ -5,8 +5,8 @@ from uuid import UUID, uuid4
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from src.messages import BaseMessage, FunctionCallingMessage, OpenAIMessage
-from src.types import RoleType, OpenAIBackendRole
+from qbot.messages import BaseMessage, FunctionCallingMessage, OpenAIMessage
+from qbot.types import RoleType, OpenAIBackendRole
 
 
 class MemoryRecord(BaseModel):
@@ -1,7 +1,7 @@
 from copy import deepcopy
 from typing import Any, Dict, List
 
-from src.memories.storages.base import BaseKeyValueStorage
+from qbot.memories.storages.base import BaseKeyValueStorage
 
 
 class InMemoryKeyValueStorage(BaseKeyValueStorage):
@@ -2,7 +2,7 @@ from typing import Any, Dict, List,Optional
 
 from pydantic import BaseModel, ConfigDict
 
-from src.messages import BaseMessage
+from qbot.messages import BaseMessage
 
 
 class ChatAgentResponse(BaseModel):
@@ -27,7 +27,7 @@ from PIL import Image
 import numpy as np
 import imageio.v3 as iio
 
-from src.types import (
+from qbot.types import (
     RoleType,
     OpenAIBackendRole,
     OpenAIImageType
@@ -19,12 +19,12 @@ import re
 from dataclasses import dataclass
 from typing import Any, Dict, Optional, Protocol, Tuple
 
-from src.types import(
+from qbot.types import(
     OpenAIBackendRole,
     RoleType,
 )
 
-from src.messages import (
+from qbot.messages import (
     BaseMessage,
     OpenAIMessage,
     ShareGPTMessage,
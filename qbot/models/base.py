@@ -18,9 +18,9 @@ from typing import (
 from pydantic import BaseModel
 
 # Reuse the OpenAI message shape we defined in messages/base.py
-from src.messages.base import OpenAIMessage
+from qbot.messages.base import OpenAIMessage
 
-from src.types import(
+from qbot.types import(
     UnifiedModelType,
     ModelPlatformType,
     ModelType
@@ -1,19 +1,19 @@
 from typing import Dict, Optional, Type, Union, ClassVar
 
-from src.models.base import (
+from qbot.models.base import (
     BaseModelBackend,
     BaseTokenCounter,
     
 )
 
-from src.types import(
+from qbot.types import(
     UnifiedModelType,
     ModelPlatformType,
     ModelType
 )
 
-from src.models.openai_model import OpenAIModel
-from src.models.vllm_model import VLLMModel
+from qbot.models.openai_model import OpenAIModel
+from qbot.models.vllm_model import VLLMModel
 
 class ModelFactory:
     r"""Factory of backend models.
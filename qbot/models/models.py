@@ -148,14 +148,17 @@ class MarketData:
     
     def update_price(self, symbol: str, new_price: float):
         """更新股票价格"""
-        if symbol in self.stocks:
-            stock = self.stocks[symbol]
-            stock.current_price = new_price
-            stock.price_history.append(new_price)
-            
-            # 更新当日高低价
-            stock.high_price = max(stock.high_price, new_price)
-            stock.low_price = min(stock.low_price, new_price)
+        stock = self.stocks.get(symbol)
+        if stock is None:
+            return
+        stock.current_price = new_price
+        stock.price_history.append(new_price)
+        
+        # 更新当日高低价
+        if new_price > stock.high_price:
+            stock.high_price = new_price
+        if new_price < stock.low_price:
+            stock.low_price = new_price
     
     def get_current_prices(self) -> Dict[str, float]:
         """获取当前所有股票价格"""
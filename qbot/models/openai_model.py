@@ -7,15 +7,15 @@ from typing import Any, Dict, List, Optional, Type, Union
 from openai import AsyncOpenAI, AsyncStream, OpenAI, Stream
 from pydantic import BaseModel
 
-from src.messages import OpenAIMessage
-from src.models.base import BaseModelBackend
-from src.configs.models import OPENAI_API_PARAMS, ChatGPTConfig
-from src.types import(
+from qbot.messages import OpenAIMessage
+from qbot.models.base import BaseModelBackend
+from qbot.configs.models import OPENAI_API_PARAMS, ChatGPTConfig
+from qbot.types import(
     UnifiedModelType,
     ModelPlatformType,
     ModelType
 )
-from src.utils.token_counter import BaseTokenCounter, OpenAITokenCounter
+from qbot.utils.token_counter import BaseTokenCounter, OpenAITokenCounter
 
 
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any
 from .base import TextPrompt
 from .template_dict import TextPromptDict
-from src.types import RoleType
+from qbot.types import RoleType
 
 class PyTestCodePromptTemplateDict(TextPromptDict):
     """
@@ -4,7 +4,7 @@ from typing import Any, Optional
 
 from .base import TextPrompt
 from .template_dict import TextPromptDict
-from src.types import RoleType  
+from qbot.types import RoleType  
 
 
 class ResearchPromptTemplateDict(TextPromptDict):
@@ -5,7 +5,7 @@ from typing import Any, Dict
 # Import your project's prompt base (TextPrompt, get_system_information)
 from .base import TextPrompt, get_system_information
 # Keep RoleType aligned with your project; replace if you use a different enum/type
-from src.types import RoleType
+from qbot.types import RoleType
 
 
 class TextPromptDict(Dict[Any, TextPrompt]):
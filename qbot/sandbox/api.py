@@ -13,6 +13,9 @@ def run_environment_safely(
     timeout_sec: int = 30,
     debug: bool = False,
     auto_cleanup: bool = True,
+    pip_cache_dir: Optional[str] = None,
+    no_deps: bool = False,
+    use_uv: bool = False,
 ) -> Dict[str, Any]:
     sb = EnvironmentSandbox(
         memory_limit_mb=memory_limit_mb,
@@ -20,6 +23,9 @@ def run_environment_safely(
         wall_time_limit=timeout_sec + 5,
         debug=debug,
         auto_cleanup=auto_cleanup,
+        pip_cache_dir=pip_cache_dir,
+        no_deps=no_deps,
+        use_uv=use_uv,
     )
     
     try:
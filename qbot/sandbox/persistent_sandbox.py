@@ -8,6 +8,7 @@ import subprocess
 import json
 import signal
 import shutil
+import stat
 import ast
 import threading
 import uuid
@@ -16,6 +17,9 @@ from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional,Sequence
 from .core import HEAVY_PACKAGES, _global_cleaner
 
+# exec_bash 返回的 stdout/stderr 各自最多保留的字节数（保留末尾部分）
+MAX_OUTPUT_BYTES = 64 * 1024
+
 class PersistentEnvironmentSandbox:
     
     def __init__(
@@ -28,6 +32,9 @@ class PersistentEnvironmentSandbox:
         debug: bool = True,
         auto_cleanup: bool = True,
         timeout_minutes: int = 5,
+        pip_cache_dir: Optional[str] = None,
+        no_deps: bool = False,
+        use_uv: bool = False,
     ):
         self.session_id = session_id or str(uuid.uuid4())
         self.base_mem_mb = memory_limit_mb
@@ -40,6 +47,14 @@ class PersistentEnvironmentSandbox:
         self.auto_cleanup = auto_cleanup
         self.session_timeout = timeout_minutes#！！！
         self.timeout_minutes = timeout_minutes
+        # pip 缓存目录，多个会话共用时重复依赖无需重新下载；为None时不使用缓存
+        self.pip_cache_dir = os.path.abspath(os.path.expanduser(pip_cache_dir)) if pip_cache_dir else None
+        if self.pip_cache_dir:
+            os.makedirs(self.pip_cache_dir, exist_ok=True)
+        # 依赖已在外部一次性解析并锁定版本时，安装时跳过依赖解析；可在 run_code 中逐次覆盖
+        self.no_deps = no_deps
+        # 显式开启且宿主机装有 uv 时用 uv pip 安装依赖，解析和下载比 pip 快很多；默认仍用 pip
+        self.use_uv = use_uv
         
         # 持久化状态
         self.venv_path: Optional[str] = None
@@ -155,6 +170,16 @@ class PersistentEnvironmentSandbox:
             python_executable = f"{self.venv_path}/bin/python"
         else:
             python_executable = sys.executable
+        
+        uv_bin = shutil.which("uv") if self.use_uv else None
+        if uv_bin:
+            # uv 不使用 pip 的 --no-cache-dir，缓存开关写法不同
+            install_cmd_prefix = [uv_bin, "pip", "install", "--quiet", "--python", python_executable]
+            cache_args = ["--cache-dir", self.pip_cache_dir] if self.pip_cache_dir else ["--no-cache"]
+        else:
+            install_cmd_prefix = [python_executable, "-m", "pip", "install", "--quiet"]
+            cache_args = ["--cache-dir", self.pip_cache_dir] if self.pip_cache_dir else ["--no-cache-dir"]
+        install_cmd_prefix += cache_args
 
         script = f'''
 import sys
@@ -396,10 +421,12 @@ while True:
         
         elif command_type == "INSTALL":
             packages = command_data.get("packages", [])
+            if command_data.get("no_deps"):
+                packages = ["--no-deps"] + packages
             try:
                 log_debug(f"Installing packages: {{packages}}")
                 result = _original_subprocess.run(
-                    [sys.executable, "-m", "pip", "install", "--quiet", "--no-cache-dir"] + packages,
+                    {install_cmd_prefix!r} + packages,
                     capture_output=True, text=True, timeout=300
                 )
                 if result.returncode == 0:
@@ -518,6 +545,10 @@ print(json.dumps({{"type": "EXIT", "session_id": "{self.session_id}"}}, ensure_a
                 'PYTHONUNBUFFERED': '1',
                 'MALLOC_ARENA_MAX': '2',
             })
+            if self.pip_cache_dir:
+                # exec_bash 中直接调用 pip / uv 时也使用同一缓存
+                env['PIP_CACHE_DIR'] = self.pip_cache_dir
+                env['UV_CACHE_DIR'] = self.pip_cache_dir
             
             if self.debug:
                 print(f"[DEBUG] Starting process with Python: {python_bin}")
@@ -845,8 +876,11 @@ print(json.dumps({{"type": "EXIT", "session_id": "{self.session_id}"}}, ensure_a
         time.sleep(0.2)
 
 
-    def install_packages(self, packages: List[str]) -> Dict[str, Any]:
-        """安装Python包"""
+    def install_packages(self, packages: List[str], no_deps: Optional[bool] = None) -> Dict[str, Any]:
+        """安装Python包
+
+        no_deps 为 None 时使用会话创建时的设置
+        """
         if not packages:
             return {"type": "SUCCESS", "message": "无需安装包"}
         
@@ -864,7 +898,8 @@ print(json.dumps({{"type": "EXIT", "session_id": "{self.session_id}"}}, ensure_a
         
         command = {
             "type": "INSTALL",
-            "packages": packages
+            "packages": packages,
+            "no_deps": self.no_deps if no_deps is None else no_deps,
         }
         
         response = self._send_command(command, timeout=300)  # 5分钟超时
@@ -872,14 +907,15 @@ print(json.dumps({{"type": "EXIT", "session_id": "{self.session_id}"}}, ensure_a
     
     def run_code(self, code: str, requirements: Optional[List[str]] = None, timeout_sec: int = 60, **kwargs) -> Dict[str, Any]:
         """运行代码 - 兼容会话管理器接口"""
-        result = self.run_code_original(code, requirements)
+        result = self.run_code_original(code, requirements, no_deps=kwargs.get('no_deps'))
 
         if requirements and result.get('success', False):
             self._installed_packages.update(requirements)
         
         return result
     
-    def run_code_original(self, code: str, env_requirements: Optional[List[str]] = None) -> Dict[str, Any]:
+    def run_code_original(self, code: str, env_requirements: Optional[List[str]] = None,
+                          no_deps: Optional[bool] = None) -> Dict[str, Any]:
         """在持久化进程中运行代码 - 原始实现"""
         self.touch()
         
@@ -900,7 +936,7 @@ print(json.dumps({{"type": "EXIT", "session_id": "{self.session_id}"}}, ensure_a
         
         # 2. 安装依赖
         if env_requirements:
-            install_result = self.install_packages(env_requirements)
+            install_result = self.install_packages(env_requirements, no_deps=no_deps)
             if install_result.get("type") not in ["SUCCESS", "INSTALL_SUCCESS"]:
                 return {
                     "success": False,
@@ -996,6 +1032,34 @@ print(json.dumps({{"type": "EXIT", "session_id": "{self.session_id}"}}, ensure_a
         file_path = os.path.join(self.work_dir, relative_path)
         with open(file_path, "r", encoding="utf-8") as f:
             return f.read()
+
+    def stat_file(self, relative_path: str) -> Dict[str, Any]:
+        """
+        Stat a path relative to the sandbox's working directory.
+
+        Runs on the host side, so no command is sent to the sandbox process.
+
+        Args:
+            relative_path (str): The relative file path.
+
+        Returns:
+            Dict[str, Any]: ``exists``, plus ``is_file``, ``size`` and ``mtime`` when it exists.
+
+        Raises:
+            PermissionError: If the path resolves outside the working directory.
+        """
+        # Stat runs on the host, so keep it from probing paths outside the sandbox
+        file_path = self._resolve_dest_in_sandbox(relative_path)
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            return {"exists": False}
+        return {
+            "exists": True,
+            "is_file": stat.S_ISREG(st.st_mode),
+            "size": st.st_size,
+            "mtime": st.st_mtime,
+        }
     
 
     def _resolve_dest_in_sandbox(self, dest_relative: str) -> Path:
@@ -1207,6 +1271,16 @@ import subprocess
 import os
 import sys
 import json
+import tempfile
+
+def _read_tail(f, limit={MAX_OUTPUT_BYTES}):
+    # 输出先落到临时文件，只把末尾 limit 字节读回内存
+    size = f.seek(0, 2)
+    f.seek(max(0, size - limit))
+    data = f.read().decode("utf-8", errors="replace")
+    if size > limit:
+        data = f"...[输出过长，已截断前 {{size - limit}} 字节]\\n" + data
+    return data
 
 try:
     os.chdir(r"{self.work_dir}")
@@ -1238,21 +1312,21 @@ try:
     print(f"DEBUG: VIRTUAL_ENV = {{env.get('VIRTUAL_ENV', 'Not set')}}", file=sys.stderr)
     print(f"DEBUG: PATH prefix = {{env.get('PATH', '')[:100]}}...", file=sys.stderr)
 
-    result = subprocess.run(
-        ["bash", "-c", bash_command],
-        capture_output=True,
-        text=True,
-        timeout={timeout},
-        env=env,
-        cwd=r"{self.work_dir}"
-    )
-
-    output = {{
-        "success": result.returncode == 0,
-        "stdout": result.stdout,
-        "stderr": result.stderr,
-        "exit_code": result.returncode
-    }}
+    with tempfile.TemporaryFile() as out_f, tempfile.TemporaryFile() as err_f:
+        result = subprocess.run(
+            ["bash", "-c", bash_command],
+            stdout=out_f,
+            stderr=err_f,
+            timeout={timeout},
+            env=env,
+            cwd=r"{self.work_dir}"
+        )
+        output = {{
+            "success": result.returncode == 0,
+            "stdout": _read_tail(out_f),
+            "stderr": _read_tail(err_f),
+            "exit_code": result.returncode
+        }}
     
     print("__BASH_RESULT_START__")
     print(json.dumps(output))
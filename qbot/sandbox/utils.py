@@ -4,10 +4,17 @@ from __future__ import annotations
 """
 import os
 import json
+import functools
 import requests
 import tomli
 from typing import List, Optional, Dict, Any
 
+# GitHub 请求超时（秒）
+REQUEST_TIMEOUT = 15
+
+# (工具文件路径, 修改时间, 服务名) -> 依赖列表，只缓存成功获取的结果
+_requirements_cache: Dict[tuple, List[str]] = {}
+
 
 def get_github_repo_files(github_url):
     """获取GitHub仓库文件列表"""
@@ -17,7 +24,7 @@ def get_github_repo_files(github_url):
 
     url = f"https://api.github.com/repos/{owner}/{repo}/contents/"
     print(url)
-    resp = requests.get(url)
+    resp = requests.get(url, timeout=REQUEST_TIMEOUT)
     if resp.status_code != 200:
         print(f"访问失败: {url}")
         print(f"返回内容: {resp.text}")
@@ -48,30 +55,40 @@ def find_dependencies(data):
     return deps
 
 
+@functools.lru_cache(maxsize=16)
+def _load_tools_index(tools_path, mtime):
+    """解析工具配置文件，返回 {服务名(小写): github地址}；mtime 变化时重新解析"""
+    with open(tools_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    index = {}
+    for server in data.get("servers", []):
+        name = server.get("server_name") or server.get("name")
+        if name:
+            index.setdefault(name.strip().lower(), server.get("metadata", {}).get("github"))
+    return index
+
+
 def get_requirements(tools_path, mcp_server):
     """从工具配置文件获取依赖需求"""
     print(tools_path)
     print(mcp_server)
-    with open(tools_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    servers = data.get("servers", [])
-    github_url = None
-    for server in servers:
-        name = server.get("server_name") or server.get("name")
-        if name and name.strip().lower() == mcp_server.strip().lower():
-            github_url = server.get("metadata", {}).get("github")
-            print("找到 github 地址：", github_url)
-            break
+    mtime = os.path.getmtime(tools_path)
+    cache_key = (tools_path, mtime, mcp_server.strip().lower())
+    if cache_key in _requirements_cache:
+        return list(_requirements_cache[cache_key])
+    
+    github_url = _load_tools_index(tools_path, mtime).get(mcp_server.strip().lower())
     if not github_url:
         print("未找到对应的 github_url！")
         return None
+    print("找到 github 地址：", github_url)
 
     files = get_github_repo_files(github_url)
     requirements = []
     for f in files:
         if f["name"].endswith(".toml"):
             print(f"发现 toml 文件: {f['name']}")
-            resp = requests.get(f["download_url"])
+            resp = requests.get(f["download_url"], timeout=REQUEST_TIMEOUT)
             if resp.status_code == 200:
                 tmp_path = f"./tmp_{f['name']}"
                 with open(tmp_path, "wb") as tmp_file:
@@ -94,7 +111,7 @@ def get_requirements(tools_path, mcp_server):
                 print(f"下载失败: {f['download_url']}")
         if f["name"] == "requirements.txt":
             print(f"发现 requirements.txt 文件: {f['name']}")
-            resp = requests.get(f["download_url"])
+            resp = requests.get(f["download_url"], timeout=REQUEST_TIMEOUT)
             if resp.status_code == 200:
                 # 直接处理 resp.text，不需要保存为临时文件
                 lines = resp.text.splitlines()
@@ -107,4 +124,6 @@ def get_requirements(tools_path, mcp_server):
             else:
                 print(f"下载失败: {f['download_url']}")
 
+    if requirements:
+        _requirements_cache[cache_key] = list(requirements)
     return requirements
@@ -21,8 +21,8 @@ from pydub.utils import mediainfo
 import openai
 
 
-from src.toolkits import FunctionTool
-from src.toolkits.base import BaseToolkit
+from qbot.toolkits import FunctionTool
+from qbot.toolkits.base import BaseToolkit
 
 
 class AudioAnalysisToolkit(BaseToolkit):
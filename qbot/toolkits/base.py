@@ -1,7 +1,7 @@
 from typing import List, Optional
 
-from src.toolkits import FunctionTool
-from src.utils import with_timeout
+from qbot.toolkits import FunctionTool
+from qbot.utils import with_timeout
 
 
 class BaseToolkit():
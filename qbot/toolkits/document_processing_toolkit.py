@@ -48,9 +48,9 @@ from .image_analysis_toolkit import ImageAnalysisToolkit
 from .video_analysis_toolkit import VideoAnalysisToolkit
 from .excel_toolkit import ExcelToolkit
 
-from src.utils.llm import call_llm  # keep your import path 
-from src.toolkits import FunctionTool
-from src.toolkits.base import BaseToolkit
+from qbot.utils.llm import call_llm  # keep your import path 
+from qbot.toolkits import FunctionTool
+from qbot.toolkits.base import BaseToolkit
 
 
 class DocumentProcessingToolkit(BaseToolkit):
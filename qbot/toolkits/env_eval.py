@@ -24,12 +24,12 @@ from __future__ import annotations
 
 from typing import Optional, List, Dict
 
-from src.agents import ChatAgent, PlayerAgent, DeepResearchAgent
-from src.types import ModelPlatformType, ModelType
-from src.models import ModelFactory
-from src.prompts import PlayerPromptTemplateDict, DeepResearchPromptTemplateDict
-from src.toolkits import WebSearchToolkit, SandboxToolkit, FunctionTool
-from src.toolkits.base import BaseToolkit
+from qbot.agents import ChatAgent, PlayerAgent, DeepResearchAgent
+from qbot.types import ModelPlatformType, ModelType
+from qbot.models import ModelFactory
+from qbot.prompts import PlayerPromptTemplateDict, DeepResearchPromptTemplateDict
+from qbot.toolkits import WebSearchToolkit, SandboxToolkit, FunctionTool
+from qbot.toolkits.base import BaseToolkit
 
 
 class EnvEvalToolkit(BaseToolkit):
@@ -20,8 +20,8 @@ from typing import List, Optional
 import pandas as pd
 from openpyxl import load_workbook
 
-from src.toolkits import FunctionTool
-from src.toolkits.base import BaseToolkit
+from qbot.toolkits import FunctionTool
+from qbot.toolkits.base import BaseToolkit
 
 
 class ExcelToolkit(BaseToolkit):
@@ -13,9 +13,9 @@ from jsonschema.validators import Draft202012Validator as JSONValidator
 from pydantic import BaseModel, create_model
 from pydantic.fields import FieldInfo
 
-from src.models import BaseModelBackend, ModelFactory
-from src.types import ModelPlatformType, ModelType
-from src.utils import get_pydantic_object_schema, to_pascal
+from qbot.models import BaseModelBackend, ModelFactory
+from qbot.types import ModelPlatformType, ModelType
+from qbot.utils import get_pydantic_object_schema, to_pascal
 
 
 
@@ -225,7 +225,7 @@ def generate_docstring(
         str: The generated docstring.
     """
 
-    from src.agents import ChatAgent
+    from qbot.agents import ChatAgent
 
     # Create the docstring prompt
     docstring_prompt = textwrap.dedent(
@@ -394,6 +394,29 @@ class FunctionTool:
         else:
             return self.func(*args, **kwargs)
 
+    @property
+    def openai_tool_schema(self) -> Dict[str, Any]:
+        r"""The OpenAI tool schema of this function."""
+        return self._openai_tool_schema
+
+    @openai_tool_schema.setter
+    def openai_tool_schema(self, schema: Dict[str, Any]) -> None:
+        self._openai_tool_schema = schema
+        self._schema_validated = False
+
+    def _validated_schema(self) -> Dict[str, Any]:
+        r"""Returns the OpenAI tool schema, validating it only on first use
+        after it was built or modified.
+
+        The schema is fixed once the tool is created, so repeated getter
+        calls (e.g. one per LLM invocation) skip the JSON Schema check. All
+        setters of this class reset the validation state.
+        """
+        if not self._schema_validated:
+            self.validate_openai_tool_schema(self._openai_tool_schema)
+            self._schema_validated = True
+        return self._openai_tool_schema
+
     @property
     def is_async(self) -> bool:
         return inspect.iscoroutinefunction(inspect.unwrap(self.func))
@@ -459,8 +482,7 @@ class FunctionTool:
         Returns:
             Dict[str, Any]: The OpenAI tool schema for this function.
         """
-        self.validate_openai_tool_schema(self.openai_tool_schema)
-        return self.openai_tool_schema
+        return self._validated_schema()
 
     def set_openai_tool_schema(self, schema: Dict[str, Any]) -> None:
         r"""Sets the OpenAI tool schema for this function.
@@ -482,8 +504,7 @@ class FunctionTool:
             Dict[str, Any]: The schema of the function within the OpenAI tool
                 schema.
         """
-        self.validate_openai_tool_schema(self.openai_tool_schema)
-        return self.openai_tool_schema["function"]
+        return self._validated_schema()["function"]
 
     def set_openai_function_schema(
         self,
@@ -496,6 +517,7 @@ class FunctionTool:
                 set within the OpenAI tool schema.
         """
         self.openai_tool_schema["function"] = openai_function_schema
+        self._schema_validated = False
 
     def get_function_name(self) -> str:
         r"""Gets the name of the function from the OpenAI tool schema.
@@ -503,8 +525,7 @@ class FunctionTool:
         Returns:
             str: The name of the function.
         """
-        self.validate_openai_tool_schema(self.openai_tool_schema)
-        return self.openai_tool_schema["function"]["name"]
+        return self._validated_schema()["function"]["name"]
 
     def set_function_name(self, name: str) -> None:
         r"""Sets the name of the function in the OpenAI tool schema.
@@ -513,6 +534,7 @@ class FunctionTool:
             name (str): The name of the function to set.
         """
         self.openai_tool_schema["function"]["name"] = name
+        self._schema_validated = False
 
     def get_function_description(self) -> str:
         r"""Gets the description of the function from the OpenAI tool
@@ -521,8 +543,7 @@ class FunctionTool:
         Returns:
             str: The description of the function.
         """
-        self.validate_openai_tool_schema(self.openai_tool_schema)
-        return self.openai_tool_schema["function"]["description"]
+        return self._validated_schema()["function"]["description"]
 
     def set_function_description(self, description: str) -> None:
         r"""Sets the description of the function in the OpenAI tool schema.
@@ -531,6 +552,7 @@ class FunctionTool:
             description (str): The description for the function.
         """
         self.openai_tool_schema["function"]["description"] = description
+        self._schema_validated = False
 
     def get_paramter_description(self, param_name: str) -> str:
         r"""Gets the description of a specific parameter from the function
@@ -543,8 +565,7 @@ class FunctionTool:
         Returns:
             str: The description of the specified parameter.
         """
-        self.validate_openai_tool_schema(self.openai_tool_schema)
-        return self.openai_tool_schema["function"]["parameters"]["properties"][
+        return self._validated_schema()["function"]["parameters"]["properties"][
             param_name
         ]["description"]
 
@@ -564,6 +585,7 @@ class FunctionTool:
         self.openai_tool_schema["function"]["parameters"]["properties"][
             param_name
         ]["description"] = description
+        self._schema_validated = False
 
     def get_parameter(self, param_name: str) -> Dict[str, Any]:
         r"""Gets the schema for a specific parameter from the function schema.
@@ -574,8 +596,7 @@ class FunctionTool:
         Returns:
             Dict[str, Any]: The schema of the specified parameter.
         """
-        self.validate_openai_tool_schema(self.openai_tool_schema)
-        return self.openai_tool_schema["function"]["parameters"]["properties"][
+        return self._validated_schema()["function"]["parameters"]["properties"][
             param_name
         ]
 
@@ -593,6 +614,7 @@ class FunctionTool:
         self.openai_tool_schema["function"]["parameters"]["properties"][
             param_name
         ] = value
+        self._schema_validated = False
 
     def synthesize_openai_tool_schema(
         self,
@@ -667,7 +689,7 @@ class FunctionTool:
             Any: Synthesized output from the function execution. If no
                 synthesis model is provided, a warning is logged.
         """
-        from src.agents import ChatAgent
+        from qbot.agents import ChatAgent
 
         # Retrieve the function source code
         function_string = inspect.getsource(self.func)
@@ -751,8 +773,7 @@ class FunctionTool:
             Dict[str, Any]: the dictionary containing information of
                 parameters of this function.
         """
-        self.validate_openai_tool_schema(self.openai_tool_schema)
-        return self.openai_tool_schema["function"]["parameters"]["properties"]
+        return self._validated_schema()["function"]["parameters"]["properties"]
 
     @parameters.setter
     def parameters(self, value: Dict[str, Any]) -> None:
@@ -769,3 +790,4 @@ class FunctionTool:
         except SchemaError as e:
             raise e
         self.openai_tool_schema["function"]["parameters"]["properties"] = value
+        self._schema_validated = False
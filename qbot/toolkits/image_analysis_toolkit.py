@@ -22,9 +22,9 @@ from urllib.parse import urlparse
 import requests
 from PIL import Image
 
-from src.toolkits import FunctionTool
-from src.toolkits.base import BaseToolkit
-from src.utils.llm import image_llm
+from qbot.toolkits import FunctionTool
+from qbot.toolkits.base import BaseToolkit
+from qbot.utils.llm import image_llm
 
 
 class ImageAnalysisToolkit(BaseToolkit):
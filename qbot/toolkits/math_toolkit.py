@@ -1,7 +1,7 @@
 from typing import List
 
-from src.toolkits.base import BaseToolkit
-from src.toolkits.function_tool import FunctionTool
+from qbot.toolkits.base import BaseToolkit
+from qbot.toolkits.function_tool import FunctionTool
 
 
 class MathToolkit(BaseToolkit):
@@ -3,11 +3,11 @@ from __future__ import annotations
 import shlex
 from typing import Any, Dict, List, Optional
 
-from src.toolkits import FunctionTool
-from src.toolkits.sandbox_toolkit import SandboxToolkit
-from src.toolkits.base import BaseToolkit
-from src.models import BaseModelBackend
-from src.messages import OpenAIMessage
+from qbot.toolkits import FunctionTool
+from qbot.toolkits.sandbox_toolkit import SandboxToolkit
+from qbot.toolkits.base import BaseToolkit
+from qbot.models import BaseModelBackend
+from qbot.messages import OpenAIMessage
 
 # Mapping from benchmark type to the player script on the host side.
 BENCHMARK_FILE_PATH = {
@@ -36,9 +36,9 @@ from typing import Any, Dict, List, Optional, Tuple
 from typing_extensions import Literal
 from loguru import logger
 
-from src.sandbox import create_persistent_sandbox
-from src.toolkits import FunctionTool
-from src.toolkits.base import BaseToolkit
+from qbot.sandbox import create_persistent_sandbox
+from qbot.toolkits import FunctionTool
+from qbot.toolkits.base import BaseToolkit
 
 MAX_RETURN_CHARS = 20_000
 
@@ -96,10 +96,10 @@ class SandboxToolkit(BaseToolkit):
         content: Optional[str] = None,
     ) -> dict[str, Any]:
         r"""
-        Read or write a text/python file inside the shared sandbox workspace.
+        Read, write or stat a text/python file inside the shared sandbox workspace.
 
         Args:
-            action (str): Operation to perform. Use **"save"** to write text, or **"read"** to read text.
+            action (str): Operation to perform. Use **"save"** to write text, **"read"** to read text, or **"stat"** to check whether a file exists.
             file_path (str): File path relative to the sandbox root.
             content (str,optional): Text to write when `action="save"`. If omitted, an empty string is written.
 
@@ -107,6 +107,7 @@ class SandboxToolkit(BaseToolkit):
             dict[str, Any]: JSON object indicating success or failure.
                 - On **save**: includes a success flag and a short message.
                 - On **read**: includes a success flag, a (possibly truncated) text snippet, and total character length.
+                - On **stat**: includes a success flag, `exists`, and `size`/`mtime` when the file exists.
                 - On error: includes a failure flag and a human-readable error message.
         """
         try:
@@ -119,6 +120,8 @@ class SandboxToolkit(BaseToolkit):
                 text = session.read_file(file_path)
                 snippet, total_len = self._safe_snippet(text)
                 return {"success": True, "content": snippet, "full_length": total_len}
+            elif action == "stat":
+                return {"success": True, **session.stat_file(file_path)}
             else:
                 return {"success": False, "error": f"Unknown action '{action}'"}
         except Exception as e:
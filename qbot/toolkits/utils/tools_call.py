@@ -1,6 +1,7 @@
 import json
 import re
 import secrets
+from functools import lru_cache
 from types import SimpleNamespace
 from typing import Any, Dict, List, Optional
 
@@ -78,15 +79,16 @@ def _parse_xml_params(body: str) -> Dict[str, Any]:
 # 1) <multi_tool_use.parallel> … </multi_tool_use.parallel>
 #    parse inner <tool_use name="...">…</tool_use> (robust to escaped quotes)
 # ────────────────────────────────────────────────
+_inner_tool_use_rx = re.compile(
+    r'<\s*tool_use\s+name\s*=\s*\\?(?P<q>["\'])'
+    r'(?P<name>(?:\\.|(?!\1).)*?)\\?(?P=q)\s*>'
+    r'(?P<body>.*?)</\s*tool_use\s*>',
+    re.DOTALL | re.IGNORECASE
+)
+
 def parse_multi_tool_use(body: str) -> List[ToolCall]:
     calls: List[ToolCall] = []
-    inner_rx = re.compile(
-        r'<\s*tool_use\s+name\s*=\s*\\?(?P<q>["\'])'
-        r'(?P<name>(?:\\.|(?!\1).)*?)\\?(?P=q)\s*>'
-        r'(?P<body>.*?)</\s*tool_use\s*>',
-        re.DOTALL | re.IGNORECASE
-    )
-    for m in inner_rx.finditer(body):
+    for m in _inner_tool_use_rx.finditer(body):
         raw_name = _unescape_attr_val(m.group('name'))
         tool = raw_name.split('.')[-1]
         args = _parse_xml_params(m.group('body'))
@@ -103,6 +105,9 @@ def parse_single_tool_use(body: str, wrapper_name: str) -> List[ToolCall]:
 # ────────────────────────────────────────────────
 # 3) <functions.xxx> … </functions.xxx>
 # ────────────────────────────────────────────────
+# key="value" / key='value' attributes on the opening tag
+_attr_pair_rx = re.compile(r'(\w+)\s*=\s*\\?(["\'])(.*?)\\?\2', re.DOTALL)
+
 def parse_functions_tool_use(body: str,
                              tag_type: str,
                              attr_blob: str) -> List[ToolCall]:
@@ -113,10 +118,7 @@ def parse_functions_tool_use(body: str,
     """
     tool_name = tag_type.split('.')[-1]
     # a) attributes on opening tag → initial args (support escaped & single quotes)
-    attr_pairs = re.findall(
-        r'(\w+)\s*=\s*\\?(["\'])(.*?)\\?\2',
-        attr_blob, re.DOTALL
-    )
+    attr_pairs = _attr_pair_rx.findall(attr_blob)
     args: Dict[str, Any] = {k: _unescape_attr_val(v) for k, _, v in attr_pairs}
 
     # b) body
@@ -132,9 +134,13 @@ def parse_functions_tool_use(body: str,
 # ────────────────────────────────────────────────
 # Strip helpers for analysis/final & multi-blocks
 # ────────────────────────────────────────────────
+_analysis_final_rx = re.compile(
+    r'<(analysis|final)\b[^>]*>.*?</\1\s*>',
+    re.DOTALL | re.IGNORECASE
+)
+
 def _strip_analysis_final(text: str) -> str:
-    return re.sub(r'<(analysis|final)\b[^>]*>.*?</\1\s*>',
-                  '', text, flags=re.DOTALL | re.IGNORECASE)
+    return _analysis_final_rx.sub('', text)
 
 _multi_block_rx = re.compile(
     r'<\s*multi_tool_use\.parallel\b[^>]*>(?P<body>.*?)</\s*multi_tool_use\.parallel\s*>',
@@ -162,28 +168,33 @@ _single_tool_rx = re.compile(
     re.DOTALL | re.IGNORECASE
 )
 
+# Combined opener for <functions.xxx> and <tool_use ...>, preserves original order
+_wrapper_open_rx = re.compile(
+    r'<\s*(functions\.[\w\-]+|tool_use)\b([^>]*)>',
+    re.DOTALL | re.IGNORECASE
+)
+
+@lru_cache(maxsize=128)
+def _closing_tag_rx(tag: str) -> re.Pattern:
+    """Compiled closing-tag pattern for *tag*; the set of tool tags is small."""
+    return re.compile(rf'</\s*{re.escape(tag)}\s*>', re.DOTALL | re.IGNORECASE)
+
 def _scan_remaining_wrappers(text: str) -> List[ToolCall]:
     """
     Scan remaining text (after multi blocks stripped) in document order,
     capturing <functions.xxx> and classic <tool_use ...> blocks.
     """
     calls: List[ToolCall] = []
-    # Combined opener to preserve original order
-    open_rx = re.compile(
-        r'<\s*(functions\.[\w\-]+|tool_use)\b([^>]*)>',
-        re.DOTALL | re.IGNORECASE
-    )
     pos = 0
     n = len(text)
     while True:
-        m = open_rx.search(text, pos)
+        m = _wrapper_open_rx.search(text, pos)
         if not m:
             break
         tag = m.group(1)
         attr_blob = m.group(2)
         body_start = m.end()
-        close_rx = re.compile(rf'</\s*{re.escape(tag)}\s*>', re.DOTALL | re.IGNORECASE)
-        m_close = close_rx.search(text, body_start)
+        m_close = _closing_tag_rx(tag).search(text, body_start)
         body = text[body_start:m_close.start()] if m_close else text[body_start:]
 
         if tag.startswith('functions.'):
@@ -235,18 +246,13 @@ def _scan_and_strip_remaining_wrappers(text: str) -> tuple[List[ToolCall], str]:
         cleaned_text -> original text with the matched blocks removed
     """
     calls: List[ToolCall] = []
-    # Unified opener to preserve original ordering between <functions.*> and <tool_use>
-    open_rx = re.compile(
-        r'<\s*(functions\.[\w\-]+|tool_use)\b([^>]*)>',
-        re.DOTALL | re.IGNORECASE
-    )
 
     parts: List[str] = []  # chunks of text to keep
     pos = 0
     n = len(text)
 
     while True:
-        m = open_rx.search(text, pos)
+        m = _wrapper_open_rx.search(text, pos)
         if not m:
             break
 
@@ -255,8 +261,7 @@ def _scan_and_strip_remaining_wrappers(text: str) -> tuple[List[ToolCall], str]:
         body_start = m.end()
 
         # Find the corresponding closing tag
-        close_rx = re.compile(rf'</\s*{re.escape(tag)}\s*>', re.DOTALL | re.IGNORECASE)
-        m_close = close_rx.search(text, body_start)
+        m_close = _closing_tag_rx(tag).search(text, body_start)
 
         # If no closing tag is found, stop stripping to avoid destroying content
         if not m_close:
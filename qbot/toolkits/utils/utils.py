@@ -5,14 +5,14 @@ import textwrap
 from typing import Any, Callable, Dict, List, Optional, Union
 from openai.types.chat.chat_completion import ChatCompletion, Choice
 
-from src.messages import (
+from qbot.messages import (
     ToolCallRequest
 )
-from src.memories import(
+from qbot.memories import(
     ToolCallingRecord
 )
 
-from src.toolkits import FunctionTool
+from qbot.toolkits import FunctionTool
 
 def convert_to_function_tool(
     tool: Union[FunctionTool, Callable],
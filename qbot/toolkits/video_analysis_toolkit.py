@@ -17,8 +17,8 @@ from urllib.parse import urlparse
 from google import genai
 from google.genai import types
 
-from src.toolkits import FunctionTool
-from src.toolkits.base import BaseToolkit
+from qbot.toolkits import FunctionTool
+from qbot.toolkits.base import BaseToolkit
 
 
 class VideoAnalysisToolkit(BaseToolkit):
@@ -13,8 +13,8 @@ import urllib.error
 from dotenv import load_dotenv
 load_dotenv()
 
-from src.toolkits import FunctionTool
-from src.toolkits import BaseToolkit
+from qbot.toolkits import FunctionTool
+from qbot.toolkits import BaseToolkit
 
 
 class WebSearchToolkit(BaseToolkit):
@@ -3,7 +3,7 @@ import os
 from enum import Enum, EnumMeta
 from typing import cast
 
-from src.types.unified_model_type import UnifiedModelType
+from qbot.types.unified_model_type import UnifiedModelType
 
 
 class RoleType(Enum):
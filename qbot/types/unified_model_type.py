@@ -2,7 +2,7 @@ from threading import Lock
 from typing import TYPE_CHECKING, ClassVar, Dict, Union, cast
 
 if TYPE_CHECKING:
-    from src.types import ModelType
+    from qbot.types import ModelType
 
 
 class UnifiedModelType(str):
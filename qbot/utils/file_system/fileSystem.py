@@ -28,9 +28,10 @@ import threading
 import mimetypes
 import base64
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import fnmatch
 
 from .utils import classify_file_by_extension 
@@ -48,6 +49,14 @@ def _sha256(data: bytes) -> str:
     h.update(data)
     return h.hexdigest()
 
+def _sha256_file(path: Path, chunk_size: int = 64 * 1024) -> str:
+    """SHA-256 of a file, read in chunks so large files are never held in memory whole."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
 
@@ -70,7 +79,8 @@ class FileSystem:
         self.root = Path(root)
         self.root.mkdir(parents=True, exist_ok=True)
         self.registry_path = self.root / 'registry.json'
-        self._registry_lock = threading.Lock()
+        # Re-entrant: read-modify-write sequences hold it around _read/_write_registry
+        self._registry_lock = threading.RLock()
         if not self.registry_path.exists():
             self._write_registry({})
 
@@ -95,9 +105,10 @@ class FileSystem:
             self.registry_path.write_text(json.dumps(reg, ensure_ascii=False, indent=2))
 
     def _upsert_entry(self, entry: Dict[str, Any]) -> None:
-        reg = self._read_registry()
-        reg[entry['file_path']] = entry
-        self._write_registry(reg)
+        with self._registry_lock:
+            reg = self._read_registry()
+            reg[entry['file_path']] = entry
+            self._write_registry(reg)
 
     def _validate_path(self, file_path: str) -> Path:
         """
@@ -118,6 +129,15 @@ class FileSystem:
             raise FileSystemError(f"Access outside root is forbidden: {file_path}")
 
         return target
+
+    def _relative_path(self, abs_path: Path) -> str:
+        """
+        Root-relative POSIX form of a path returned by `_validate_path`.
+
+        Used as the registry key so that e.g. "dir/../a.txt" and "a.txt"
+        name the same entry.
+        """
+        return abs_path.relative_to(self.root.resolve()).as_posix()
     
     def _commit_registry_entry(
         self,
@@ -138,6 +158,18 @@ class FileSystem:
         has_text : bool
             Flag indicating whether `text_path` is meaningful.
         """
+        self._upsert_entry(self._build_registry_entry(
+            file_path=file_path, text_path=text_path, has_text=has_text,
+        ))
+
+    def _build_registry_entry(
+        self,
+        *,
+        file_path: str,
+        text_path: Optional[str] = None,
+        has_text: bool = False,
+    ) -> Dict[str, Any]:
+        """(private) Build the registry entry for `file_path` from its current state on disk."""
         abs_path = self.root / file_path            # absolute Path object
         mime     = mimetypes.guess_type(str(abs_path))[0] or "application/octet-stream"
 
@@ -146,14 +178,13 @@ class FileSystem:
             "path": file_path,                      # alias,便于兼容旧字段
             "size": abs_path.stat().st_size,
             "mime": mime,
-            "content_hash": _sha256(abs_path.read_bytes()),
+            "content_hash": _sha256_file(abs_path),
             "last_modified": _now_iso(),
             "has_text": has_text,
         }
         if has_text and text_path:
             entry["text_path"] = text_path     
-        
-        self._upsert_entry(entry)
+        return entry
 
     def list_files(
         self,
@@ -265,44 +296,122 @@ class FileSystem:
         Raises:
             FileSystemError: On path-traversal attempts or any I/O failure.
         """
-        abs_path = self._validate_path(file_path)
-        lock     = self._locks.setdefault(abs_path, threading.Lock())
-        kind     = classify_file_by_extension(file_path)
+        abs_path  = self._validate_path(file_path)
+        file_path = self._relative_path(abs_path)
+        lock      = self._locks.setdefault(abs_path, threading.Lock())
 
         with lock:
-            if kind in ("text", "structured"):
-                # text and structured both via text_handler / structured_handler
-                handler = self.text_handler if kind == "text" else self.structured_handler
-                fd, tmp = tempfile.mkstemp(suffix=abs_path.suffix, dir=str(abs_path.parent))
-                os.close(fd)
-                tmp_path = Path(tmp)
-                try:
-                    handler.write(tmp_path, content)
-                    os.replace(tmp_path, abs_path)
-                finally:
-                    tmp_path.unlink(missing_ok=True)
-                has_text, text_path = False, None
-
-            else:
-                # binary placeholder + sidecar
-                abs_path.parent.mkdir(parents=True, exist_ok=True)
-                if not abs_path.exists():
-                    abs_path.write_bytes(b"")
-                text_path = f"{file_path}.description.txt"
-                desc_full = self._validate_path(text_path)
-                desc_full.parent.mkdir(parents=True, exist_ok=True)
-                data = content if isinstance(content, str) else \
-                       base64.b64encode(content or b"").decode('ascii')
-                desc_full.write_text(data, encoding='utf-8')
-                has_text = True
-
+            has_text, text_path = self._write_payload(file_path, abs_path, content)
             self._commit_registry_entry(
                 file_path=file_path,
-                text_path=text_path if has_text else None,
+                text_path=text_path,
                 has_text=has_text,
             )
 
         return True
+
+    def save_files(self, files: Dict[str, str | bytes | None]) -> bool:
+        """
+        Save several files at once, updating the registry in a single write.
+
+        Each payload is written exactly as `save_file` would write it; only the
+        registry update is batched, so N files cost one registry read/write
+        instead of N.
+
+        Args:
+            files (Dict[str, str | bytes | None]): Mapping of path relative to
+                root -> content.
+
+        Returns:
+            bool: True on successful write.
+
+        Raises:
+            FileSystemError: On path-traversal attempts or any I/O failure.
+        """
+        entries: List[Dict[str, Any]] = []
+        for file_path, content in files.items():
+            abs_path  = self._validate_path(file_path)
+            file_path = self._relative_path(abs_path)
+            lock      = self._locks.setdefault(abs_path, threading.Lock())
+            with lock:
+                has_text, text_path = self._write_payload(file_path, abs_path, content)
+                entries.append(self._build_registry_entry(
+                    file_path=file_path, text_path=text_path, has_text=has_text,
+                ))
+
+        with self._registry_lock:
+            reg = self._read_registry()
+            for entry in entries:
+                reg[entry['file_path']] = entry
+            self._write_registry(reg)
+        return True
+
+    def register_existing(self, file_path: str) -> bool:
+        """
+        Register a file that was written to disk without going through `save_file`.
+
+        The file is left untouched; only its registry entry (size, mime, hash)
+        is created or refreshed. An existing “.description.txt” sidecar is
+        recorded as the file's text override.
+
+        Args:
+            file_path (str): Path relative to root of an existing file.
+
+        Returns:
+            bool: True once the entry is written.
+
+        Raises:
+            FileSystemError: On path-traversal attempts or if the file does not exist.
+        """
+        abs_path = self._validate_path(file_path)
+        if not abs_path.is_file():
+            raise FileSystemError(f"Not a file: {file_path}")
+        file_path = self._relative_path(abs_path)
+        text_path = f"{file_path}.description.txt"
+        has_text = self._validate_path(text_path).is_file()
+        self._commit_registry_entry(
+            file_path=file_path,
+            text_path=text_path if has_text else None,
+            has_text=has_text,
+        )
+        return True
+
+    def _write_payload(
+        self,
+        file_path: str,
+        abs_path: Path,
+        content: str | bytes | None,
+    ) -> tuple[bool, Optional[str]]:
+        """(private) Write `content` for `file_path` to disk; returns (has_text, text_path)."""
+        kind = classify_file_by_extension(file_path)
+        if kind in ("text", "structured"):
+            # text and structured both via text_handler / structured_handler
+            handler = self.text_handler if kind == "text" else self.structured_handler
+            abs_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(suffix=abs_path.suffix, dir=str(abs_path.parent))
+            os.close(fd)
+            tmp_path = Path(tmp)
+            try:
+                handler.write(tmp_path, content)
+                os.replace(tmp_path, abs_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+            has_text, text_path = False, None
+
+        else:
+            # binary placeholder + sidecar
+            abs_path.parent.mkdir(parents=True, exist_ok=True)
+            if not abs_path.exists():
+                abs_path.write_bytes(b"")
+            text_path = f"{file_path}.description.txt"
+            desc_full = self._validate_path(text_path)
+            desc_full.parent.mkdir(parents=True, exist_ok=True)
+            data = content if isinstance(content, str) else \
+                   base64.b64encode(content or b"").decode('ascii')
+            desc_full.write_text(data, encoding='utf-8')
+            has_text = True
+        return has_text, (text_path if has_text else None)
+
     def delete_file(self, file_path: str) -> bool:
         """
         Remove a file and its description override from disk and registry.
@@ -362,9 +471,13 @@ class FileSystem:
         if kind == 'binary':
             if not real.exists():
                 self.read_file(file_path)
-            result = self.binary_handler.edit(path=real, edits=patch, desc=target)
-        elif kind == "text":
-            result = self.text_handler.edit(path=real, edits=patch, desc=target)
+            handler = self.binary_handler
+        else:
+            handler = self.text_handler
+        try:
+            result = handler.edit(path=real, patch=patch, desc=target)
+        except OSError as e:
+            raise FileSystemError(f"Cannot edit file {file_path}: {e}")
 
         if result['changed']:
             self._commit_registry_entry(
@@ -386,7 +499,18 @@ class FileSystem:
         Returns:
             str: A Markdown-formatted list of method signatures and summaries.
         """
-        tools = methods or ["list_files", "read_file", "save_file", "delete_file", "edit_file"]
+        tools = tuple(methods or ("list_files", "read_file", "save_file", "delete_file", "edit_file"))
+        return FileSystem._describe_methods(tools)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _describe_methods(tools: Tuple[str, ...]) -> str:
+        """
+        Build the `describe_api` text for the given method names, in order.
+
+        Signatures and docstrings do not change at runtime, so the result is
+        cached per tuple of names.
+        """
         lines = ["FileSystem API", "-----------------"]
         for name in tools:
             func = getattr(FileSystem, name, None)
@@ -2,12 +2,27 @@ import base64
 from pathlib import Path
 import os, tempfile, threading, difflib
 from typing import Optional, List, Dict, Any
-from src.deep_research_agent.tools import DocumentProcessingToolkit
+from unidiff import PatchSet, UnidiffParseError
 
 class BinaryFileHandler:
     
     def __init__(self) -> None:
-        self.document_tool = DocumentProcessingToolkit()
+        self._document_tool = None
+        # Per-path locks so concurrent edits of one file are serialised
+        self._locks: Dict[Path, threading.Lock] = {}
+
+    @property
+    def document_tool(self):
+        """DocumentProcessingToolkit instance, created on first read.
+
+        The toolkit pulls in the PDF/Office/media extraction stack, which
+        writing, editing and describing binary files never need.
+        """
+        if self._document_tool is None:
+            from qbot.toolkits.document_processing_toolkit import DocumentProcessingToolkit
+            self._document_tool = DocumentProcessingToolkit()
+        return self._document_tool
+
     def read(self, file_path:str, max_base64_size=1024*1024)->str:
         flag,content = self.document_tool.extract_document_content(file_path)
         print(content)
@@ -51,6 +66,9 @@ class BinaryFileHandler:
                 patch_set = PatchSet.from_string(patch)
             except UnidiffParseError as e:
                 raise OSError(f"Invalid unified diff: {e}")
+            if not patch_set:
+                # unidiff skips text without ---/+++ headers instead of failing
+                raise OSError("Invalid unified diff: no file sections found")
 
             # 2. Determine the a/ and b/ prefixes for this file
             label = desc or path.as_posix()
@@ -1,7 +1,10 @@
 # Standard library
 import os
+import re
 import json
+import math
 import csv
+import warnings
 from pathlib import Path
 from typing import Any, List, Dict
 import yaml
@@ -9,12 +12,126 @@ import toml
 import xmltodict
 
 # ── third-party round-trip helpers ────────────────────────────────────────────
-from ruamel.yaml import YAML                         
 import tomlkit                                      
 from configobj import ConfigObj                     
-from lxml import etree
-from src.deep_research_agent.tools import ExcelToolkit
-import pandas as pd
+# ExcelToolkit and pandas are imported on first Excel use: most structured
+# files never need them and they dominate this module's import time.
+
+# libyaml-backed loader/dumpers when PyYAML was built with it; the pure-Python
+# ones are several times slower on the same documents. Files are written with
+# the safe dumper so they read back with the same YAML 1.1 scalar rules.
+try:
+    from yaml import CSafeLoader as _YamlLoader, CDumper as _YamlDumper, CSafeDumper as _YamlSafeDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, Dumper as _YamlDumper, SafeDumper as _YamlSafeDumper
+    warnings.warn(
+        "PyYAML is installed without the libyaml C extension; "
+        "YAML parsing and Markdown rendering fall back to the slower pure-Python implementation.",
+        RuntimeWarning,
+    )
+
+# TOML: native parser (rtoml) when installed, otherwise tomllib/tomli.
+# tomlkit stays the last resort for parsing; it keeps formatting, which only
+# matters when writing a TOMLDocument back out.
+try:
+    import rtoml as _fast_toml
+except ImportError:
+    _fast_toml = None
+
+try:
+    import tomllib as _tomllib
+except ImportError:
+    try:
+        import tomli as _tomllib
+    except ImportError:
+        _tomllib = None
+
+# Buffer for writers that emit many small chunks (csv.writer, yaml.dump);
+# formats serialised to one string/bytes object are written in a single call.
+_WRITE_BUFFER_SIZE = 128 * 1024
+
+# JSON: orjson (C, emits UTF-8 bytes directly) when installed, else stdlib json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson turns integers outside the 64-bit range into floats when parsing.
+# Any run of 19+ digits may be such an integer, so those documents (and the
+# NaN/Infinity literals orjson rejects) are parsed by stdlib json instead.
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19,}")
+_LONG_DIGITS_STR = re.compile(r"\d{19,}")
+
+
+def _json_loads(data: bytes | str) -> Any:
+    """Parse one JSON document."""
+    if orjson is not None:
+        long_digits = _LONG_DIGITS_STR if isinstance(data, str) else _LONG_DIGITS_BYTES
+        if long_digits.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Whether `obj` contains a NaN or infinite float anywhere inside it."""
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialise to UTF-8 JSON bytes, keeping non-ASCII text as-is."""
+    # orjson writes NaN/Infinity as null; stdlib json keeps them readable
+    if orjson is not None and not _has_non_finite(obj):
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits, which stdlib json still handles
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def _parse_toml(text: str) -> Dict[str, Any]:
+    """Parse TOML into plain Python types with the fastest parser available."""
+    if _fast_toml is not None:
+        return _fast_toml.loads(text)
+    if _tomllib is not None:
+        return _tomllib.loads(text)
+    return tomlkit.parse(text).unwrap()
+
+
+def _write_xlsx(path: Path, rows: List[Dict]) -> None:
+    """Write dict rows to .xlsx directly with openpyxl, without building a DataFrame.
+
+    Columns are the union of the row keys in first-seen order, and missing
+    values are left empty, as `pandas.DataFrame(rows).to_excel` would do.
+    """
+    from openpyxl import Workbook
+
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    ws.append(columns)
+    for row in rows:
+        ws.append([row.get(col) for col in columns])
+    wb.save(path)
+
+
+def _yaml_block(data: Any) -> str:
+    """Render parsed data as the fenced YAML block returned by `read`."""
+    return f"```yaml\n{yaml.dump(data, Dumper=_YamlDumper, allow_unicode=True, indent=4)}\n```"
+
 
 class StructuredFileHandler:
     """
@@ -22,12 +139,15 @@ class StructuredFileHandler:
     CSV, JSON, Excel (XLS/XLSX), XML, YAML, TOML, INI/CFG/CONF.
     """
     def __init__(self): 
-        self.excel_tool = ExcelToolkit()
-        
-        # ruamel.yaml instance (round-trip safe)
-        self._yaml = YAML()
-        self._yaml.preserve_quotes = True
-        self._yaml.indent(mapping=2, sequence=4, offset=2)
+        self._excel_tool = None
+
+    @property
+    def excel_tool(self):
+        """ExcelToolkit instance, created on first Excel write."""
+        if self._excel_tool is None:
+            from qbot.toolkits.excel_toolkit import ExcelToolkit
+            self._excel_tool = ExcelToolkit()
+        return self._excel_tool
 
     def read(self, file_path: str) -> str:
         """
@@ -39,59 +159,12 @@ class StructuredFileHandler:
         Returns:
             str: Parsed content as string in Markdown format.
         """
-        try:
-            ext = os.path.splitext(file_path.lower())[1]
-            
-            if ext in {".json", ".jsonld"}:
-                with open(file_path, "r", encoding="utf-8") as fp:
-                    data = json.load(fp)
-                    return f"```yaml\n{yaml.dump(data, allow_unicode=True, indent=4)}\n```"
-            
-            if ext == ".jsonl":
-                with open(file_path, "r", encoding="utf-8") as fp:
-                    data = [json.loads(line) for line in fp if line.strip()]
-                    return f"```yaml\n{yaml.dump(data, allow_unicode=True, indent=4)}\n```"
-            
-            if ext == '.csv':
-                with open(file_path, 'r', encoding='utf-8') as fp:
-                    reader = csv.reader(fp)
-                    data = list(reader)
-                return f"```yaml\n{yaml.dump(data, allow_unicode=True, indent=4)}\n```"
-            
-            if ext in {'.xls', '.xlsx'}:
-                df = pd.read_excel(file_path)
-                data = df.to_dict('records')
-                return f"```yaml\n{yaml.dump(data, allow_unicode=True, indent=4)}\n```"
-            
-            if ext == ".xml":
-                with open(file_path, 'r', encoding='utf-8') as fp:
-                    data = xmltodict.parse(fp.read())
-                return f"```yaml\n{yaml.dump(data, allow_unicode=True, indent=4)}\n```"
-            
-            if ext in {".yaml", ".yml"}:
-                with open(file_path, "r", encoding="utf-8") as fp:
-                    data = self._yaml.load(fp)
-                    return f"```yaml\n{yaml.dump(data, allow_unicode=True, indent=4)}\n```"
-            
-            if ext == ".toml":
-                text = Path(file_path).read_text(encoding="utf-8")
-                data = tomlkit.parse(text)
-                return f"```yaml\n{yaml.dump(data.unwrap(), allow_unicode=True, indent=4)}\n```"
-            
-            if ext in {".ini", ".cfg", ".conf"}:
-                config = ConfigObj(file_path, encoding="utf-8")
-                def config_to_dict(conf):
-                    result = {}
-                    for key, value in conf.items():
-                        if isinstance(value, dict):
-                            result[key] = config_to_dict(value)
-                        else:
-                            result[key] = value
-                    return result
-                data = config_to_dict(config)
-                return f"```yaml\n{yaml.dump(data, allow_unicode=True, indent=4)}\n```"
-            
+        ext = os.path.splitext(file_path.lower())[1]
+        reader = self._READERS.get(ext)
+        if reader is None:
             raise ValueError(f"Unsupported structured file format: {file_path}")
+        try:
+            return _yaml_block(reader(self, file_path))
         except (FileNotFoundError, PermissionError, json.JSONDecodeError, yaml.YAMLError, toml.TomlDecodeError) as e:
             raise ValueError(f"Error reading file {file_path}: {str(e)}") from e
 
@@ -99,73 +172,137 @@ class StructuredFileHandler:
         try:
             path = Path(file_path)
             path.parent.mkdir(parents=True, exist_ok=True)
-            ext = path.suffix.lower()
+            writer = self._WRITERS.get(path.suffix.lower())
+            if writer is None:
+                raise ValueError(f"Unsupported structured file format: {file_path}")
+            writer(self, path, content)
+            return True
+        except Exception as e:
+            print(f"Write error: {e}")
+            return False
 
-            if ext in {".json", ".jsonld"}:
-                if not isinstance(content, (dict, list)):
-                    raise ValueError("JSON write expects dict or list")
-                with open(path, "w", encoding="utf-8") as fp:
-                    json.dump(content, fp, ensure_ascii=False, indent=2)
-                return True
+    # ── readers: file path -> parsed data ─────────────────────────────────────
+    # JSON, XML and YAML parsers take raw bytes and detect the encoding
+    # themselves, so these files are read in one call with no text layer.
 
-            if ext == ".jsonl":
-                lines = content if isinstance(content, list) else [content]
-                with open(path, "w", encoding="utf-8") as fp:
-                    for obj in lines:
-                        fp.write(json.dumps(obj, ensure_ascii=False) + "\n")
-                return True
+    def _read_json(self, file_path: str) -> Any:
+        return _json_loads(Path(file_path).read_bytes())
 
-            if ext == ".csv":
-                if not (isinstance(content, list) and all(isinstance(row, list) for row in content)):
-                    raise ValueError("CSV write expects List[List[str]]")
-                with open(path, "w", newline="", encoding="utf-8") as fp:
-                    writer = csv.writer(fp, delimiter=',', quoting=csv.QUOTE_MINIMAL)
-                    writer.writerows(content)
-                return True
+    def _read_jsonl(self, file_path: str) -> List[Any]:
+        lines = Path(file_path).read_bytes().splitlines()
+        return [_json_loads(line) for line in lines if line.strip()]
 
-            if ext in {".xls", ".xlsx"}:
-                if not (isinstance(content, list) and all(isinstance(r, dict) for r in content)):
-                    raise ValueError("Excel write expects List[Dict]")
-                self.excel_tool.write_excel(str(path), content)
-                return True
+    def _read_csv(self, file_path: str) -> List[List[str]]:
+        # newline="" as the csv module requires: the reader handles line
+        # endings itself, so quoted fields keep their embedded "\r\n"
+        with open(file_path, 'r', encoding='utf-8', newline='') as fp:
+            return list(csv.reader(fp))
 
-            if ext == ".xml":
-                if not isinstance(content, dict):
-                    raise ValueError("XML write expects dict")
-                xml_str = xmltodict.unparse(content, pretty=True)
-                path.write_text(xml_str, encoding="utf-8")
-                return True
+    def _read_excel(self, file_path: str) -> List[Dict]:
+        import pandas as pd
+        return pd.read_excel(file_path).to_dict('records')
 
-            if ext in {".yaml", ".yml"}:
-                with path.open("w", encoding="utf-8") as fp:
-                    self._yaml.dump(content, fp)
-                return True
+    def _read_xml(self, file_path: str) -> Dict[str, Any]:
+        # xmltodict runs on expat (C); bytes skip a str -> UTF-8 re-encode
+        return xmltodict.parse(Path(file_path).read_bytes())
 
-            if ext == ".toml":
-                if isinstance(content, dict):
-                    content = tomlkit.dumps(content)
-                elif not isinstance(content, tomlkit.TOMLDocument):
-                    raise ValueError("TOML write expects dict or tomlkit.TOMLDocument")
-                path.write_text(content, encoding="utf-8")
-                return True
+    def _read_yaml(self, file_path: str) -> Any:
+        return yaml.load(Path(file_path).read_bytes(), Loader=_YamlLoader)
 
-            if ext in {".ini", ".cfg", ".conf"}:
-                if not isinstance(content, dict):
-                    raise ValueError("INI write expects dict")
-                config = ConfigObj()
-                for section, values in content.items():
-                    config[section] = {}
-                    if isinstance(values, dict):
-                        for k, v in values.items():
-                            config[section][k] = v
-                config.filename = str(path)
-                config.write()
-                return True
-        
-            raise ValueError(f"Unsupported structured file format: {file_path}")
-        except Exception as e:
-            print(f"Write error: {e}")
-            return False
+    def _read_toml(self, file_path: str) -> Dict[str, Any]:
+        return _parse_toml(Path(file_path).read_text(encoding="utf-8"))
+
+    def _read_ini(self, file_path: str) -> Dict[str, Any]:
+        def config_to_dict(conf):
+            result = {}
+            for key, value in conf.items():
+                if isinstance(value, dict):
+                    result[key] = config_to_dict(value)
+                else:
+                    result[key] = value
+            return result
+        return config_to_dict(ConfigObj(file_path, encoding="utf-8"))
+
+    # ── writers: (path, content) -> None, ValueError on unexpected content ────
+
+    def _write_json(self, path: Path, content: Any) -> None:
+        if not isinstance(content, (dict, list)):
+            raise ValueError("JSON write expects dict or list")
+        path.write_bytes(_json_dumps(content, indent=True))
+
+    def _write_jsonl(self, path: Path, content: Any) -> None:
+        lines = content if isinstance(content, list) else [content]
+        # Whole file assembled in memory and written with one call
+        path.write_bytes(b"".join(_json_dumps(obj) + b"\n" for obj in lines))
+
+    def _write_csv(self, path: Path, content: Any) -> None:
+        if not (isinstance(content, list) and all(isinstance(row, list) for row in content)):
+            raise ValueError("CSV write expects List[List[str]]")
+        with open(path, "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as fp:
+            writer = csv.writer(fp, delimiter=',', quoting=csv.QUOTE_MINIMAL)
+            writer.writerows(content)
+
+    def _write_excel(self, path: Path, content: Any) -> None:
+        if not (isinstance(content, list) and all(isinstance(r, dict) for r in content)):
+            raise ValueError("Excel write expects List[Dict]")
+        if path.suffix.lower() == ".xlsx":
+            _write_xlsx(path, content)
+        else:
+            # Legacy .xls is not an openpyxl format
+            self.excel_tool.write_excel(str(path), content)
+
+    def _write_xml(self, path: Path, content: Any) -> None:
+        if not isinstance(content, dict):
+            raise ValueError("XML write expects dict")
+        path.write_text(xmltodict.unparse(content, pretty=True), encoding="utf-8")
+
+    def _write_yaml(self, path: Path, content: Any) -> None:
+        with path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as fp:
+            yaml.dump(content, fp, Dumper=_YamlSafeDumper, allow_unicode=True, sort_keys=False)
+
+    def _write_toml(self, path: Path, content: Any) -> None:
+        if isinstance(content, tomlkit.TOMLDocument):
+            # Round-trip document: let tomlkit keep its comments/layout
+            text = tomlkit.dumps(content)
+        elif isinstance(content, dict):
+            text = _fast_toml.dumps(content) if _fast_toml is not None else tomlkit.dumps(content)
+        else:
+            raise ValueError("TOML write expects dict or tomlkit.TOMLDocument")
+        path.write_text(text, encoding="utf-8")
+
+    def _write_ini(self, path: Path, content: Any) -> None:
+        if not isinstance(content, dict):
+            raise ValueError("INI write expects dict")
+        config = ConfigObj()
+        for section, values in content.items():
+            config[section] = {}
+            if isinstance(values, dict):
+                for k, v in values.items():
+                    config[section][k] = v
+        config.filename = str(path)
+        config.write()
+
+    # Extension (lower-case, with dot) -> reader / writer, built once per class
+    _READERS = {
+        ".json": _read_json, ".jsonld": _read_json,
+        ".jsonl": _read_jsonl,
+        ".csv": _read_csv,
+        ".xls": _read_excel, ".xlsx": _read_excel,
+        ".xml": _read_xml,
+        ".yaml": _read_yaml, ".yml": _read_yaml,
+        ".toml": _read_toml,
+        ".ini": _read_ini, ".cfg": _read_ini, ".conf": _read_ini,
+    }
+    _WRITERS = {
+        ".json": _write_json, ".jsonld": _write_json,
+        ".jsonl": _write_jsonl,
+        ".csv": _write_csv,
+        ".xls": _write_excel, ".xlsx": _write_excel,
+        ".xml": _write_xml,
+        ".yaml": _write_yaml, ".yml": _write_yaml,
+        ".toml": _write_toml,
+        ".ini": _write_ini, ".cfg": _write_ini, ".conf": _write_ini,
+    }
 
     def edit(self, file_path, new_data):
         # Edit structured data in a file.
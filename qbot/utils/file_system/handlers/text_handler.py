@@ -6,6 +6,10 @@ from typing import Optional, Dict, Any, Union
 from unidiff import PatchSet, UnidiffParseError
 
 class TextFileHandler:
+    def __init__(self) -> None:
+        # Per-path locks so concurrent edits of one file are serialised
+        self._locks: Dict[Path, threading.Lock] = {}
+
     def write(
         self,
         path: Path,
@@ -77,6 +81,9 @@ class TextFileHandler:
                 patch_set = PatchSet.from_string(patch)
             except UnidiffParseError as e:
                 raise OSError(f"Invalid unified diff: {e}")
+            if not patch_set:
+                # unidiff skips text without ---/+++ headers instead of failing
+                raise OSError("Invalid unified diff: no file sections found")
 
             # 2. Determine the a/ and b/ prefixes for this file
             label = desc or path.as_posix()
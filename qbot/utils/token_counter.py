@@ -12,9 +12,9 @@ from typing import Any, Dict, List, Optional
 
 from PIL import Image
 
-# Reuse your OpenAI-style message alias from src/messages
+# Reuse your OpenAI-style message alias from qbot/messages
 # (it's typically: OpenAIMessage = Dict[str, Any])
-from src.messages import OpenAIMessage
+from qbot.messages import OpenAIMessage
 
 
 # ---- Vision token-counting constants (aligned with OpenAI vision docs) ----
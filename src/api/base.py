@@ -50,6 +50,12 @@ class BaseAPI(ABC):
         
         self.session = requests.Session()
         
+        # 复用长连接，避免每次请求重新进行TCP/TLS握手
+        # 重试由 _make_request 上的 retry_on_failure 负责，这里不再叠加
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # 设置默认请求头
         self.session.headers.update({
             'User-Agent': 'AI-Fund-Trading-Bot/1.0',
@@ -19,6 +19,13 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+_VALID_SIDES = frozenset({'BUY', 'SELL'})
+_VALID_ORDER_TYPES = frozenset({
+    'LIMIT', 'MARKET', 'STOP_LOSS', 'STOP_LOSS_LIMIT',
+    'TAKE_PROFIT', 'TAKE_PROFIT_LIMIT', 'LIMIT_MAKER'
+})
+_VALID_TIME_IN_FORCE = frozenset({'GTC', 'IOC', 'FOK'})
+
 
 def retry_on_failure(max_retries: int = 3, delay: float = 1.0, 
                     backoff_factor: float = 2.0, 
@@ -65,6 +72,8 @@ def rate_limit(calls_per_second: float = 10.0):
     """
     速率限制装饰器
     
+    上次调用时间保存在每个被装饰函数自己的闭包中，不同函数之间互不共享。
+    
     Args:
         calls_per_second: 每秒允许的调用次数
     """
@@ -135,7 +144,7 @@ def validate_side(side: str) -> str:
     
     side = side.upper().strip()
     
-    if side not in ['BUY', 'SELL']:
+    if side not in _VALID_SIDES:
         raise ValidationException(f"Invalid side: {side}. Must be 'BUY' or 'SELL'")
     
     return side
@@ -159,13 +168,8 @@ def validate_order_type(order_type: str) -> str:
     
     order_type = order_type.upper().strip()
     
-    valid_types = [
-        'LIMIT', 'MARKET', 'STOP_LOSS', 'STOP_LOSS_LIMIT',
-        'TAKE_PROFIT', 'TAKE_PROFIT_LIMIT', 'LIMIT_MAKER'
-    ]
-    
-    if order_type not in valid_types:
-        raise ValidationException(f"Invalid order type: {order_type}. Must be one of {valid_types}")
+    if order_type not in _VALID_ORDER_TYPES:
+        raise ValidationException(f"Invalid order type: {order_type}. Must be one of {sorted(_VALID_ORDER_TYPES)}")
     
     return order_type
 
@@ -188,7 +192,7 @@ def validate_time_in_force(time_in_force: str) -> str:
     
     time_in_force = time_in_force.upper().strip()
     
-    if time_in_force not in ['GTC', 'IOC', 'FOK']:
+    if time_in_force not in _VALID_TIME_IN_FORCE:
         raise ValidationException(f"Invalid time in force: {time_in_force}. Must be 'GTC', 'IOC', or 'FOK'")
     
     return time_in_force
@@ -252,6 +256,12 @@ def validate_price(price: Union[float, str, Decimal]) -> str:
     return str(p)
 
 
+@functools.lru_cache(maxsize=None)
+def _quantizer(precision: int) -> Decimal:
+    """返回指定精度的量化单位，如 precision=4 时为 Decimal('0.0000')"""
+    return Decimal('0.' + '0' * precision)
+
+
 def format_decimal(value: Union[float, str, Decimal], precision: int = 8) -> str:
     """
     格式化小数，去除尾随零
@@ -270,7 +280,7 @@ def format_decimal(value: Union[float, str, Decimal], precision: int = 8) -> str
             d = Decimal(str(value))
         
         # 量化到指定精度
-        quantized = d.quantize(Decimal('0.' + '0' * precision), rounding=ROUND_DOWN)
+        quantized = d.quantize(_quantizer(precision), rounding=ROUND_DOWN)
         
         # 转换为字符串并去除尾随零
         return str(quantized.normalize())
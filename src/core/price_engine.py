@@ -2,7 +2,7 @@ import random
 import math
 import time
 import numpy as np
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from qbot.models.models import Stock, MarketData
 from src.config.config_manager import config_manager
 from src.core.binance_client import binance_client
@@ -33,11 +33,13 @@ class PriceEngine:
         self.kline_cache = {}  # 存储每只股票的历史K线数据
         self.last_kline_update = {}  # 记录每只股票最后更新时间
         self.volume_sensitivity = 0.01  # 成交量敏感度 - 增加交易量对价格的影响
+        self.rng = np.random.default_rng()  # 批量生成随机数
         
         # 币安API集成
         self.binance_client = binance_client
         self.use_real_data = self.binance_client.is_enabled()
         self.crypto_symbols = self.binance_client.get_supported_symbols()
+        self._crypto_symbol_set = frozenset(self.crypto_symbols)  # 每次价格更新都要判断，用集合查找
         self.last_binance_update = 0
         self.binance_update_interval = config_manager.get_config().get('binance', {}).get('price_update_interval', 5)
         
@@ -47,7 +49,7 @@ class PriceEngine:
     
     def is_crypto_symbol(self, symbol: str) -> bool:
         """检查是否为加密货币交易对"""
-        return symbol in self.crypto_symbols
+        return symbol in self._crypto_symbol_set
     
     def get_real_crypto_price(self, symbol: str) -> float:
         """获取真实的加密货币价格"""
@@ -63,8 +65,19 @@ class PriceEngine:
             print(f"❌ 获取 {symbol} 价格失败: {e}")
             return None
     
-    def update_crypto_prices(self):
-        """批量更新加密货币价格"""
+    def get_real_crypto_prices(self) -> Dict[str, float]:
+        """一次请求获取所有加密货币的真实价格，失败或未启用时返回空字典"""
+        if not self.use_real_data:
+            return {}
+        
+        try:
+            return self.binance_client.get_all_prices() or {}
+        except Exception as e:
+            print(f"❌ 批量获取加密货币价格失败: {e}")
+            return {}
+    
+    def update_crypto_prices(self) -> Optional[Dict[str, float]]:
+        """批量更新加密货币价格，返回本次获取的价格；未启用、未到更新间隔或失败时返回None"""
         if not self.use_real_data:
             return
         
@@ -74,7 +87,7 @@ class PriceEngine:
         
         try:
             # 批量获取所有加密货币价格
-            prices = self.binance_client.get_all_prices()
+            prices = self.binance_client.get_all_prices() or {}
             
             for symbol, price in prices.items():
                 if symbol in self.market_data.stocks:
@@ -88,6 +101,7 @@ class PriceEngine:
             
             self.last_binance_update = current_time
             print(f"🔄 批量更新了 {len(prices)} 个加密货币价格")
+            return prices
             
         except Exception as e:
             print(f"❌ 批量更新加密货币价格失败: {e}")
@@ -111,14 +125,9 @@ class PriceEngine:
             
             name = crypto_names.get(symbol, symbol)
             
-            # 生成一些历史价格数据
-            price_history = []
-            base_price = price
-            for i in range(30):
-                variation = random.uniform(-0.05, 0.05)
-                historical_price = base_price * (1 + variation)
-                price_history.append(round(historical_price, 4))
-                base_price = historical_price
+            # 生成一些历史价格数据：一次取出30个波动，累乘得到随机游走
+            variations = self.rng.uniform(-0.05, 0.05, size=30)
+            price_history = np.round(price * np.cumprod(1 + variations), 4).tolist()
             
             # 添加到市场数据
             self.market_data.add_stock(symbol, name, price, price_history)
@@ -194,13 +203,16 @@ class PriceEngine:
         current_time = time.time()
         time_delta = current_time - self.last_update_time
         
-        # 首先更新加密货币价格（如果启用了币安API）
-        self.update_crypto_prices()
+        # 首先更新加密货币价格（如果启用了币安API），本次获取的价格在下面直接复用
+        real_prices = self.update_crypto_prices()
         
+        # 上面没有获取时，在首次遇到加密货币时批量获取一次，而不是每个交易对各请求一次
         for symbol, stock in self.market_data.stocks.items():
             # 如果是加密货币且启用了真实数据，尝试获取真实价格
             if self.is_crypto_symbol(symbol) and self.use_real_data:
-                real_price = self.get_real_crypto_price(symbol)
+                if real_prices is None:
+                    real_prices = self.get_real_crypto_prices()
+                real_price = real_prices.get(symbol)
                 if real_price is not None:
                     # 使用真实价格，但仍然应用一些交易影响
                     trade_impact = 0.0
@@ -1,6 +1,4 @@
 # test/agents/test_chat_agent.py
-import os
-import sys
 import json
 from io import BytesIO
 from unittest.mock import MagicMock
@@ -9,10 +7,6 @@ import pytest
 from PIL import Image
 from pydantic import BaseModel, Field
 
-# Ensure imports from project root (so we can import src/*)
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-sys.path.insert(0, PROJECT_ROOT)
-
 # OpenAI response types (for building mocked completions)
 from openai.types.chat.chat_completion import Choice
 from openai.types.chat.chat_completion_message import ChatCompletionMessage
@@ -3,6 +3,10 @@
 API异常类测试用例
 """
 
+import copy
+import pickle
+import tracemalloc
+
 import pytest
 from src.api.exceptions import (
     APIException,
@@ -14,16 +18,63 @@ from src.api.exceptions import (
 )
 
 
-class TestAPIException:
-    """API异常基类测试"""
+EXC_CLASSES = (
+    APIException,
+    RateLimitException,
+    AuthenticationException,
+    NetworkException,
+    ServerException,
+    ValidationException
+)
+
+
+def _make_test_class(exc_cls):
+    """为单个异常类生成测试类"""
+    class T:
+        @pytest.mark.limit_memory("50 KB")
+        def test_basic(self):
+            """测试基本异常"""
+            error = exc_cls("Test error")
+            assert str(error) == "Test error"
+            assert error.message == "Test error"
+            assert error.code is None
+            assert error.details is None
     
-    def test_api_exception_basic(self):
-        """测试基本API异常"""
-        error = APIException("Test error")
-        assert str(error) == "Test error"
-        assert error.message == "Test error"
-        assert error.code is None
-        assert error.details is None
+    T.__name__ = T.__qualname__ = f"Test{exc_cls.__name__}"
+    T.__doc__ = f"{exc_cls.__name__} 测试"
+    return T
+
+
+for _exc_cls in EXC_CLASSES:
+    globals()[f"Test{_exc_cls.__name__}"] = _make_test_class(_exc_cls)
+
+
+@pytest.mark.parametrize("cls", EXC_CLASSES, ids=lambda c: c.__name__)
+def test_mro(cls):
+    """测试异常继承关系"""
+    assert issubclass(cls, APIException) and issubclass(cls, Exception)
+
+
+@pytest.mark.parametrize("error", [
+    APIException("m", "C1", 418),
+    RateLimitException("slow down", retry_after=30),
+    ServerException(status_code=503),
+    ValidationException("bad symbol"),
+], ids=lambda e: type(e).__name__)
+@pytest.mark.parametrize("roundtrip", [
+    lambda e: pickle.loads(pickle.dumps(e)),
+    copy.copy,
+], ids=["pickle", "copy"])
+def test_roundtrip_keeps_attributes(error, roundtrip):
+    """测试异常经pickle/copy后属性不丢失"""
+    restored = roundtrip(error)
+    assert type(restored) is type(error)
+    assert str(restored) == str(error)
+    assert vars(restored) == vars(error)
+
+
+class TestExceptionOptions:
+    """异常可选参数测试"""
     
     def test_api_exception_with_code(self):
         """测试带错误码的API异常"""
@@ -42,71 +93,18 @@ class TestAPIException:
         assert error.code == -1000
         assert error.details == details
     
-    def test_api_exception_inheritance(self):
-        """测试API异常继承关系"""
-        error = APIException("Test error")
-        assert isinstance(error, Exception)
-        assert isinstance(error, APIException)
-
-
-class TestRateLimitException:
-    """速率限制异常测试"""
-    
-    def test_rate_limit_exception_basic(self):
-        """测试基本速率限制异常"""
-        error = RateLimitException("Rate limit exceeded")
-        assert str(error) == "Rate limit exceeded"
-        assert error.message == "Rate limit exceeded"
-        assert isinstance(error, APIException)
-    
     def test_rate_limit_exception_with_retry_after(self):
         """测试带重试时间的速率限制异常"""
         details = {"retry_after": 60}
         error = RateLimitException("Rate limit exceeded", details=details)
         assert error.details["retry_after"] == 60
     
-    def test_rate_limit_exception_inheritance(self):
-        """测试速率限制异常继承关系"""
-        error = RateLimitException("Rate limit exceeded")
-        assert isinstance(error, Exception)
-        assert isinstance(error, APIException)
-        assert isinstance(error, RateLimitException)
-
-
-class TestAuthenticationException:
-    """认证异常测试"""
-    
-    def test_authentication_exception_basic(self):
-        """测试基本认证异常"""
-        error = AuthenticationException("Invalid API key")
-        assert str(error) == "Invalid API key"
-        assert error.message == "Invalid API key"
-        assert isinstance(error, APIException)
-    
     def test_authentication_exception_with_code(self):
         """测试带错误码的认证异常"""
         error = AuthenticationException("Invalid signature", code=-1022)
         assert error.code == -1022
         assert error.message == "Invalid signature"
     
-    def test_authentication_exception_inheritance(self):
-        """测试认证异常继承关系"""
-        error = AuthenticationException("Invalid API key")
-        assert isinstance(error, Exception)
-        assert isinstance(error, APIException)
-        assert isinstance(error, AuthenticationException)
-
-
-class TestNetworkException:
-    """网络异常测试"""
-    
-    def test_network_exception_basic(self):
-        """测试基本网络异常"""
-        error = NetworkException("Connection timeout")
-        assert str(error) == "Connection timeout"
-        assert error.message == "Connection timeout"
-        assert isinstance(error, APIException)
-    
     def test_network_exception_with_details(self):
         """测试带详细信息的网络异常"""
         details = {"timeout": 30, "url": "https://api.binance.com"}
@@ -114,61 +112,40 @@ class TestNetworkException:
         assert error.details["timeout"] == 30
         assert error.details["url"] == "https://api.binance.com"
     
-    def test_network_exception_inheritance(self):
-        """测试网络异常继承关系"""
-        error = NetworkException("Connection timeout")
-        assert isinstance(error, Exception)
-        assert isinstance(error, APIException)
-        assert isinstance(error, NetworkException)
-
-
-class TestServerException:
-    """服务器异常测试"""
-    
-    def test_server_exception_basic(self):
-        """测试基本服务器异常"""
-        error = ServerException("Internal server error")
-        assert str(error) == "Internal server error"
-        assert error.message == "Internal server error"
-        assert isinstance(error, APIException)
-    
     def test_server_exception_with_code(self):
         """测试带错误码的服务器异常"""
         error = ServerException("Service unavailable", code=503)
         assert error.code == 503
         assert error.message == "Service unavailable"
     
-    def test_server_exception_inheritance(self):
-        """测试服务器异常继承关系"""
-        error = ServerException("Internal server error")
-        assert isinstance(error, Exception)
-        assert isinstance(error, APIException)
-        assert isinstance(error, ServerException)
-
-
-class TestValidationException:
-    """验证异常测试"""
-    
-    def test_validation_exception_basic(self):
-        """测试基本验证异常"""
-        error = ValidationException("Invalid parameter")
-        assert str(error) == "Invalid parameter"
-        assert error.message == "Invalid parameter"
-        assert isinstance(error, APIException)
-    
     def test_validation_exception_with_field(self):
         """测试带字段信息的验证异常"""
         details = {"field": "symbol", "value": "INVALID"}
         error = ValidationException("Invalid symbol", details=details)
         assert error.details["field"] == "symbol"
         assert error.details["value"] == "INVALID"
+
+
+class TestExceptionMemory:
+    """异常内存占用测试"""
     
-    def test_validation_exception_inheritance(self):
-        """测试验证异常继承关系"""
-        error = ValidationException("Invalid parameter")
-        assert isinstance(error, Exception)
-        assert isinstance(error, APIException)
-        assert isinstance(error, ValidationException)
+    @pytest.mark.limit_memory("512 KB")
+    def test_bulk_creation_memory(self):
+        """测试批量创建异常的内存上限"""
+        # 已在追踪时（如 python -X tracemalloc）沿用现有追踪，结束后不关闭
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        try:
+            start, _ = tracemalloc.get_traced_memory()
+            errors = [APIException("x") for _ in range(1000)]
+            end, _ = tracemalloc.get_traced_memory()
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+        
+        assert len(errors) == 1000
+        assert end - start < 400_000
 
 
 class TestExceptionChaining:
@@ -232,20 +209,16 @@ class TestExceptionComparison:
             ValidationException("Validation error")
         ]
         
-        # 所有异常都应该是APIException的实例
-        for error in errors:
-            assert isinstance(error, APIException)
+        mro_table = {type(e): set(type(e).__mro__) for e in errors}
         
-        # 检查特定类型
-        assert isinstance(errors[1], RateLimitException)
-        assert isinstance(errors[2], AuthenticationException)
-        assert isinstance(errors[3], NetworkException)
-        assert isinstance(errors[4], ServerException)
-        assert isinstance(errors[5], ValidationException)
+        # 所有异常都应该是APIException的实例，且类型与构造时一致
+        for error, expected in zip(errors, EXC_CLASSES):
+            assert APIException in mro_table[type(error)]
+            assert expected in mro_table[type(error)]
         
         # 检查类型不匹配
-        assert not isinstance(errors[1], AuthenticationException)
-        assert not isinstance(errors[2], RateLimitException)
+        assert AuthenticationException not in mro_table[RateLimitException]
+        assert RateLimitException not in mro_table[AuthenticationException]
 
 
 class TestExceptionSerialization:
@@ -3,11 +3,16 @@
 API工具模块测试用例
 """
 
+import importlib.util
+import itertools
 import pytest
 import time
 from decimal import Decimal
+from time import monotonic_ns
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
+import src.api.utils
 from src.api.utils import (
     retry_on_failure,
     rate_limit,
@@ -33,6 +38,30 @@ from src.api.exceptions import (
     ValidationException
 )
 
+_NOTIONAL_EXPECTED_1 = Decimal('75000')
+_NOTIONAL_EXPECTED_2 = Decimal('50.0005')
+
+HAS_BENCHMARK = importlib.util.find_spec("pytest_benchmark") is not None
+
+PARSE_ERROR_CASES = [
+    ({'code': -1021, 'msg': 'Timestamp outside of recvWindow'}, ValidationException),  # 时间戳错误
+    ({'code': -1022, 'msg': 'Invalid signature'}, ValidationException),  # 签名错误
+    ({'code': -2010, 'msg': 'Account has insufficient balance'}, ValidationException),  # 余额不足
+    ({'code': -1003, 'msg': 'Too many requests'}, RateLimitException),  # 速率限制
+    ({'code': -1000, 'msg': 'Unknown error'}, ServerException),  # 服务器错误
+    ({'code': -1001, 'msg': 'Disconnected'}, NetworkException),  # 网络错误
+    ({'code': -9999, 'msg': 'Unknown error code'}, APIException),  # 未知错误
+]
+
+
+def _advance_clock(monkeypatch, seconds):
+    """让 src.api.utils 中读取的时钟前进指定秒数，而不真正等待"""
+    real_time = time.time
+    monkeypatch.setattr(
+        "src.api.utils.time",
+        SimpleNamespace(time=lambda: real_time() + seconds, sleep=time.sleep)
+    )
+
 
 class TestRetryDecorator:
     """重试装饰器测试类"""
@@ -98,39 +127,81 @@ class TestRetryDecorator:
         assert call_count == 1  # 不应该重试
 
 
+class FakeClock:
+    """代替 time 模块的假时钟：sleep 只推进时间并记录等待时长"""
+    
+    def __init__(self, start=1000.0):
+        self.now = start
+        self.sleeps = []
+    
+    def time(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def rate_limited():
+    """每次调用生成一个新的限速函数，返回调用时刻"""
+    def make(calls_per_second):
+        @rate_limit(calls_per_second=calls_per_second)
+        def test_function():
+            return monotonic_ns()
+        return test_function
+    return make
+
+
 class TestRateLimitDecorator:
     """速率限制装饰器测试类"""
     
-    def test_rate_limit_basic(self):
+    def test_rate_limit_basic(self, rate_limited):
         """测试基本速率限制"""
-        call_times = []
-        
-        @rate_limit(calls_per_second=10.0)  # 每秒10次调用
-        def test_function():
-            call_times.append(time.time())
-            return "success"
+        test_function = rate_limited(10.0)  # 每秒10次调用
         
         # 连续调用两次
-        test_function()
-        test_function()
+        first = test_function()
+        second = test_function()
         
         # 检查时间间隔
-        if len(call_times) >= 2:
-            time_diff = call_times[1] - call_times[0]
-            assert time_diff >= 0.1  # 至少间隔0.1秒
+        assert second - first >= 100_000_000  # 至少间隔0.1秒
     
-    def test_rate_limit_no_delay_needed(self):
+    def test_rate_limit_no_delay_needed(self, rate_limited):
         """测试不需要延迟的情况"""
-        @rate_limit(calls_per_second=1.0)
-        def test_function():
-            return "success"
+        test_function = rate_limited(1.0)
         
-        start_time = time.time()
-        result = test_function()
-        end_time = time.time()
+        start_ns = monotonic_ns()
+        test_function()
+        end_ns = monotonic_ns()
         
-        assert result == "success"
-        assert (end_time - start_time) < 0.01  # 第一次调用应该很快
+        assert end_ns - start_ns < 10_000_000  # 第一次调用应该很快
+    
+    def test_rate_limit_state_per_function(self, rate_limited):
+        """测试不同的限速函数之间不共享状态"""
+        slow_function = rate_limited(1.0)
+        other_function = rate_limited(1.0)
+        slow_function()
+        
+        start_ns = monotonic_ns()
+        other_function()
+        end_ns = monotonic_ns()
+        
+        assert end_ns - start_ns < 10_000_000
+    
+    def test_rate_limit_consecutive_calls(self, monkeypatch):
+        """测试快速连续调用时每次都被限速到固定间隔"""
+        # 假时钟的 sleep 只推进时间，断言计算出的等待而不真正等待
+        clock = FakeClock()
+        monkeypatch.setattr(src.api.utils, "time", clock)
+        test_function = rate_limit(calls_per_second=5.0)(clock.time)
+        
+        call_times = [test_function() for _ in range(5)]
+        
+        # 首次调用不等待，之后每次都被限速到间隔 1/5 秒
+        assert clock.sleeps == pytest.approx([0.2] * 4)
+        gaps = [b - a for a, b in zip(call_times, call_times[1:])]
+        assert gaps == pytest.approx([0.2] * 4)
 
 
 class TestValidationFunctions:
@@ -213,6 +284,12 @@ class TestValidationFunctions:
         with pytest.raises(ValidationException):
             validate_time_in_force(None)
     
+    def test_valid_value_sets_are_frozen(self):
+        """测试合法取值集合在模块级冻结"""
+        assert isinstance(src.api.utils._VALID_SIDES, frozenset)
+        assert isinstance(src.api.utils._VALID_ORDER_TYPES, frozenset)
+        assert isinstance(src.api.utils._VALID_TIME_IN_FORCE, frozenset)
+    
     def test_validate_quantity_valid(self):
         """测试有效的数量"""
         assert validate_quantity(1.0) == '1'
@@ -265,10 +342,10 @@ class TestUtilityFunctions:
     def test_calculate_notional(self):
         """测试名义价值计算"""
         result = calculate_notional(1.5, 50000)
-        assert result == Decimal('75000')
+        assert result == _NOTIONAL_EXPECTED_1
         
         result = calculate_notional('0.001', '50000.5')
-        assert result == Decimal('50.0005')
+        assert result == _NOTIONAL_EXPECTED_2
     
     def test_calculate_notional_invalid(self):
         """测试无效的名义价值计算"""
@@ -278,35 +355,10 @@ class TestUtilityFunctions:
         with pytest.raises(ValidationException):
             calculate_notional(1.0, 'invalid')
     
-    def test_parse_binance_error(self):
+    @pytest.mark.parametrize("payload,expected", PARSE_ERROR_CASES)
+    def test_parse_binance_error(self, payload, expected):
         """测试币安错误解析"""
-        # 测试时间戳错误
-        error = parse_binance_error({'code': -1021, 'msg': 'Timestamp outside of recvWindow'})
-        assert isinstance(error, ValidationException)
-        
-        # 测试签名错误
-        error = parse_binance_error({'code': -1022, 'msg': 'Invalid signature'})
-        assert isinstance(error, ValidationException)
-        
-        # 测试余额不足
-        error = parse_binance_error({'code': -2010, 'msg': 'Account has insufficient balance'})
-        assert isinstance(error, ValidationException)
-        
-        # 测试速率限制
-        error = parse_binance_error({'code': -1003, 'msg': 'Too many requests'})
-        assert isinstance(error, RateLimitException)
-        
-        # 测试服务器错误
-        error = parse_binance_error({'code': -1000, 'msg': 'Unknown error'})
-        assert isinstance(error, ServerException)
-        
-        # 测试网络错误
-        error = parse_binance_error({'code': -1001, 'msg': 'Disconnected'})
-        assert isinstance(error, NetworkException)
-        
-        # 测试未知错误
-        error = parse_binance_error({'code': -9999, 'msg': 'Unknown error code'})
-        assert isinstance(error, APIException)
+        assert isinstance(parse_binance_error(payload), expected)
     
     def test_get_server_time_offset(self):
         """测试服务器时间偏移计算"""
@@ -363,7 +415,7 @@ class TestCircuitBreaker:
         with pytest.raises(APIException, match="Circuit breaker is OPEN"):
             cb.call(failing_function)
     
-    def test_circuit_breaker_half_open_state(self):
+    def test_circuit_breaker_half_open_state(self, monkeypatch):
         """测试熔断器半开状态"""
         cb = CircuitBreaker(failure_threshold=2, recovery_timeout=0.1)
         
@@ -381,7 +433,7 @@ class TestCircuitBreaker:
         assert cb.state == 'OPEN'
         
         # 等待恢复超时
-        time.sleep(0.2)
+        _advance_clock(monkeypatch, 0.2)
         
         # 下一次调用应该进入半开状态，如果成功则重置
         result = cb.call(success_function)
@@ -389,7 +441,7 @@ class TestCircuitBreaker:
         assert cb.state == 'CLOSED'
         assert cb.failure_count == 0
     
-    def test_circuit_breaker_recovery_failure(self):
+    def test_circuit_breaker_recovery_failure(self, monkeypatch):
         """测试熔断器恢复失败"""
         cb = CircuitBreaker(failure_threshold=1, recovery_timeout=0.1)
         
@@ -403,7 +455,7 @@ class TestCircuitBreaker:
         assert cb.state == 'OPEN'
         
         # 等待恢复超时
-        time.sleep(0.2)
+        _advance_clock(monkeypatch, 0.2)
         
         # 尝试恢复但失败
         with pytest.raises(Exception):
@@ -413,6 +465,33 @@ class TestCircuitBreaker:
         assert cb.state == 'OPEN'
 
 
+@pytest.mark.skipif(not HAS_BENCHMARK, reason="需要安装 pytest-benchmark")
+class TestBenchmarks:
+    """性能基准测试类 (使用 --benchmark-only 运行)"""
+    
+    def test_cb_closed_bench(self, benchmark):
+        """测试熔断器关闭状态下的调用开销"""
+        cb = CircuitBreaker(failure_threshold=10, recovery_timeout=1)
+        fn = lambda: 1
+        
+        benchmark.pedantic(cb.call, args=(fn,), rounds=1000, iterations=100)
+        assert cb.state == 'CLOSED'
+    
+    def test_rate_limit_bench(self, benchmark, monkeypatch):
+        """测试速率限制装饰器自身的开销 (时钟被替换，不会真正休眠)"""
+        clock = itertools.count(0.0, 1.0)
+        monkeypatch.setattr(
+            "src.api.utils.time",
+            SimpleNamespace(time=lambda: next(clock), sleep=lambda _: None)
+        )
+        
+        @rate_limit(calls_per_second=10.0)
+        def test_function():
+            return 1
+        
+        benchmark.pedantic(test_function, rounds=1000, iterations=100)
+
+
 class TestIntegrationScenarios:
     """集成场景测试类"""
     
@@ -438,17 +517,14 @@ class TestIntegrationScenarios:
     def test_validation_with_error_parsing(self):
         """测试验证与错误解析的集成"""
         # 测试符号验证后的错误解析
-        try:
-            symbol = validate_symbol('BTCUSDT')
-            assert symbol == 'BTCUSDT'
-            
-            # 模拟API错误响应
-            error_response = {'code': -2010, 'msg': 'Account has insufficient balance'}
-            error = parse_binance_error(error_response)
+        symbol = validate_symbol('BTCUSDT')
+        assert symbol == 'BTCUSDT'
+        
+        # 模拟API错误响应
+        error_response = {'code': -2010, 'msg': 'Account has insufficient balance'}
+        error = parse_binance_error(error_response)
+        with pytest.raises(ValidationException, match=r'(?i)insufficient balance'):
             raise error
-            
-        except ValidationException as e:
-            assert "insufficient balance" in str(e).lower()
     
     def test_rate_limit_with_retry(self):
         """测试速率限制与重试的集成"""
@@ -457,7 +533,7 @@ class TestIntegrationScenarios:
         @rate_limit(calls_per_second=5.0)  # 每秒5次调用
         @retry_on_failure(max_retries=1, delay=0.01)
         def test_function():
-            call_times.append(time.time())
+            call_times.append(monotonic_ns())
             if len(call_times) == 1:
                 raise NetworkException("First call fails")
             return "success"
@@ -468,5 +544,5 @@ class TestIntegrationScenarios:
         
         # 检查速率限制是否生效
         if len(call_times) >= 2:
-            time_diff = call_times[1] - call_times[0]
-            assert time_diff >= 0.2  # 至少间隔0.2秒
\ No newline at end of file
+            diff_ns = call_times[1] - call_times[0]
+            assert diff_ns >= 200_000_000  # 至少间隔0.2秒
\ No newline at end of file
@@ -1,41 +1,51 @@
-from typing import List
+"""
+测试套件的共享 fixtures
+
+导入路径由仓库根目录 pytest.ini 中的 pythonpath 配置，标记也在其中注册。
+这里只放全局共用的 fixtures，只被单个目录使用的放到该目录自己的 conftest.py。
+"""
+
+import os
+import tempfile
 
 import pytest
-from _pytest.config import Config
-from _pytest.nodes import Item
 from dotenv import load_dotenv
 
 load_dotenv()
 
-import sys
-from pathlib import Path
 
-"""
-Ensure project imports work in tests without setting PYTHONPATH.
-Adds both the repository root and <root>/src to sys.path.
+def _ramdisk_root():
+    """内存文件系统目录；没有 /dev/shm（非 Linux）时退回系统临时目录"""
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK):
+        return shm
+    return tempfile.gettempdir()
 
-Pytest auto-discovers conftest.py and executes it before collecting tests,
-so this path tweak applies to all tests under this directory and its subfolders.
-"""
 
-THIS_DIR = Path(__file__).resolve().parent
-REPO_ROOT = THIS_DIR.parent          # adjust to THIS_DIR.parents[2] if needed
-SRC_DIR = REPO_ROOT / "src"
+def pytest_configure(config):
+    """tmp_path 下的文件只在测试期间使用，放到内存文件系统上省去磁盘 I/O
 
-for p in (REPO_ROOT, SRC_DIR):
-    p_str = str(p)
-    if p_str not in sys.path:
-        sys.path.insert(0, p_str)
+    通过 PYTEST_DEBUG_TEMPROOT 只替换临时目录的根，pytest 仍按次编号并自动清理旧目录；
+    命令行指定了 --basetemp 或环境变量已设置时不做改动。
+    """
+    if config.option.basetemp is None:
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", _ramdisk_root())
 
 
-# 测试标记配置
-def pytest_configure(config):
-    """配置pytest标记"""
-    config.addinivalue_line("markers", "slow: 标记测试为慢速测试")
-    config.addinivalue_line("markers", "integration: 标记为集成测试")
-    config.addinivalue_line("markers", "unit: 标记为单元测试")
-    config.addinivalue_line("markers", "binance: 标记为币安API相关测试")
-    config.addinivalue_line("markers", "network: 标记为需要网络连接的测试")
+def pytest_addoption(parser):
+    """添加命令行选项"""
+    parser.addoption("--runslow", action="store_true", default=False,
+                     help="运行标记为 slow 的测试")
+
+
+def pytest_collection_modifyitems(config, items):
+    """未指定 --runslow 时跳过慢速测试"""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="需要 --runslow 才会运行")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
 
 
 @pytest.fixture(scope="session")
@@ -45,17 +55,15 @@ def test_config():
     return config_manager
 
 
+@pytest.fixture(scope="session")
+def binance_cfg(test_config):
+    """币安配置fixture"""
+    return test_config.get_config('binance')
+
+
 @pytest.fixture(scope="session")
 def binance_client():
     """币安客户端fixture"""
     from src.core.binance_client import binance_client
     return binance_client
 
-
-@pytest.fixture(autouse=True)
-def setup_test_environment():
-    """自动设置测试环境"""
-    # 在每个测试前执行的设置
-    yield
-    # 在每个测试后执行的清理
-
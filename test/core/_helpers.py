@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+币安测试共用的辅助数据与简化模型
+"""
+
+TEST_SYMBOLS = ('BTCUSDT', 'ETHUSDT', 'BNBUSDT')
+
+
+# 简化的Stock和MarketData类用于测试
+class Stock:
+    __slots__ = ('symbol', 'name', 'current_price', 'open_price', 'high_price',
+                 'low_price', 'volume', 'price_history')
+    
+    def __init__(self, symbol="", name=""):
+        self.symbol = symbol
+        self.name = name
+        self.current_price = self.open_price = self.high_price = 0.0
+        self.low_price = float('inf')  # 首次更新价格时即被替换
+        self.volume = 0
+        self.price_history = []
+
+
+class MarketData:
+    def __init__(self):
+        self.stocks = {}
+    
+    def add_stock(self, stock):
+        self.stocks[stock.symbol] = stock
+    
+    def update_price(self, symbol, new_price):
+        stock = self.stocks.get(symbol)
+        if stock is None:
+            return
+        stock.current_price = new_price
+        stock.price_history.append(new_price)
+        if new_price > stock.high_price:
+            stock.high_price = new_price
+        if new_price < stock.low_price:
+            stock.low_price = new_price
+
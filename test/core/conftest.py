@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+test/core 目录共用的 fixtures
+"""
+
+import copy
+import os
+import re
+import time
+
+import pytest
+
+from ._helpers import TEST_SYMBOLS, Stock, MarketData
+from .fixtures import binance_responses
+
+# 设置 BINANCE_LIVE=1 时，标记为 network 的币安测试直接访问真实API
+BINANCE_LIVE = os.getenv("BINANCE_LIVE") == "1"
+
+
+@pytest.fixture
+def test_symbols():
+    """币安测试使用的交易对"""
+    return TEST_SYMBOLS
+
+
+@pytest.fixture(scope="class")
+def _market_seed():
+    """预先加入测试交易对的市场数据，每个测试类只构建一次，测试中不得修改"""
+    md = MarketData()
+    for symbol in TEST_SYMBOLS:
+        md.add_stock(Stock(symbol, symbol.replace('USDT', '/USDT')))
+    return md
+
+
+@pytest.fixture
+def seeded_market(_market_seed):
+    """每个测试独立的市场数据副本，价格历史不会在测试之间累积"""
+    return copy.deepcopy(_market_seed)
+
+
+def _is_offline_binance(node):
+    """币安测试是否使用离线行情（未设置 BINANCE_LIVE 或测试未标记 network）"""
+    if node.get_closest_marker("binance") is None:
+        return False
+    return not (BINANCE_LIVE and node.get_closest_marker("network") is not None)
+
+
+# 离线时按路径返回固定行情，不区分主网/测试网/备用端点的域名
+_BINANCE_ROUTES = {
+    "/api/v3/ticker/price": binance_responses.ticker_price,
+    "/api/v3/klines": binance_responses.klines,
+    "/api/v3/ping": binance_responses.ping,
+    "/api/v3/time": binance_responses.server_time,
+}
+
+
+@pytest.fixture(autouse=True)
+def mock_binance(request):
+    """币安相关测试默认在 HTTP 层返回离线行情，客户端代码照常执行，不发起网络请求
+
+    未登记的请求会直接抛出 ConnectionError，避免测试意外访问真实接口
+    """
+    if not _is_offline_binance(request.node):
+        yield
+        return
+    
+    responses = pytest.importorskip("responses", reason="离线币安测试需要 responses")
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        for path, callback in _BINANCE_ROUTES.items():
+            rsps.add_callback(responses.GET, re.compile(r"https?://[^/]+" + re.escape(path)), callback=callback)
+        yield rsps
+
+
+@pytest.fixture(scope="session")
+def _price_cache():
+    """会话级价格缓存 {(行情模式, 键): (获取时间, 数据)}，离线与真实行情分开存放"""
+    return {}
+
+
+def _cached_fetch(cache, key, ttl, fetch):
+    """ttl秒内重复获取直接返回上次结果"""
+    now = time.monotonic()
+    hit = cache.get(key)
+    if hit is None or now - hit[0] > ttl:
+        hit = cache[key] = (now, fetch())
+    return hit[1]
+
+
+@pytest.fixture
+def cached_prices(request, binance_client, _price_cache):
+    """批量价格缓存，按当前测试的行情模式（离线/真实）分别缓存"""
+    mode = "mock" if _is_offline_binance(request.node) else "live"
+    
+    def get(ttl=60):
+        return _cached_fetch(_price_cache, (mode, "all"), ttl, binance_client.get_all_prices)
+    
+    return get
+
+
+@pytest.fixture
+def cached_symbol_price(request, binance_client, _price_cache):
+    """单个交易对价格缓存，按行情模式和交易对分别计时"""
+    mode = "mock" if _is_offline_binance(request.node) else "live"
+    
+    def get(symbol, ttl=60):
+        return _cached_fetch(_price_cache, (mode, symbol), ttl,
+                             lambda: binance_client.get_symbol_price(symbol))
+    
+    return get
+
+
+@pytest.fixture(autouse=True)
+def fast_sleep(request, monkeypatch):
+    """离线行情下的限速等待没有意义，直接跳过 time.sleep"""
+    if _is_offline_binance(request.node):
+        monkeypatch.setattr(time, "sleep", lambda *_: None)
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+离线运行币安测试时使用的固定行情
+
+按币安 REST 接口的原始 JSON 格式构造，由 conftest 在 HTTP 层返回给客户端，
+客户端自身的请求和解析逻辑照常执行。K线数据在导入时生成一次，所有测试共享。
+"""
+
+import json
+from urllib.parse import parse_qs, urlparse
+
+# 最多返回的K线条数，与币安接口默认 limit 一致
+MAX_KLINES = 500
+
+MOCK_PRICES = {
+    'BTCUSDT': 50000.0,
+    'ETHUSDT': 3000.0,
+    'BNBUSDT': 300.0,
+}
+
+# 未知交易对的K线按该价格生成
+DEFAULT_PRICE = 1.0
+
+# K线起始时间（毫秒）和间隔，间隔与 interval 参数无关
+_KLINE_START_MS = 1_700_000_000_000
+_KLINE_STEP_MS = 60 * 60 * 1000
+
+
+def _build_klines(price):
+    """按固定价格生成 /api/v3/klines 格式的K线数据"""
+    return [
+        [
+            _KLINE_START_MS + i * _KLINE_STEP_MS,
+            f"{price:.8f}",
+            f"{price * 1.002:.8f}",
+            f"{price * 0.999:.8f}",
+            f"{price * 1.001:.8f}",
+            "100.00000000",
+            _KLINE_START_MS + (i + 1) * _KLINE_STEP_MS - 1,
+            f"{price * 100:.8f}",
+            10,
+            "50.00000000",
+            f"{price * 50:.8f}",
+            "0",
+        ]
+        for i in range(MAX_KLINES)
+    ]
+
+
+MOCK_KLINES = {symbol: _build_klines(price) for symbol, price in MOCK_PRICES.items()}
+_DEFAULT_KLINES = _build_klines(DEFAULT_PRICE)
+
+
+def _query(request):
+    """请求的查询参数，每个参数只取第一个值"""
+    return {k: v[0] for k, v in parse_qs(urlparse(request.url).query).items()}
+
+
+def _json(body, status=200):
+    return status, {"Content-Type": "application/json"}, json.dumps(body)
+
+
+def ticker_price(request):
+    """GET /api/v3/ticker/price：带 symbol 时返回单个价格，否则返回全部"""
+    symbol = _query(request).get('symbol')
+    if symbol is None:
+        return _json([{"symbol": s, "price": f"{p:.8f}"} for s, p in MOCK_PRICES.items()])
+    if symbol not in MOCK_PRICES:
+        return _json({"code": -1121, "msg": "Invalid symbol."}, status=400)
+    return _json({"symbol": symbol, "price": f"{MOCK_PRICES[symbol]:.8f}"})
+
+
+def klines(request):
+    """GET /api/v3/klines"""
+    params = _query(request)
+    limit = int(params.get('limit', MAX_KLINES))
+    return _json(MOCK_KLINES.get(params.get('symbol'), _DEFAULT_KLINES)[:limit])
+
+
+def ping(request):
+    """GET /api/v3/ping"""
+    return _json({})
+
+
+def server_time(request):
+    """GET /api/v3/time"""
+    return _json({"serverTime": _KLINE_START_MS})
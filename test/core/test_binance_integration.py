@@ -5,45 +5,16 @@
 """
 
 import pytest
-import sys
-import os
-import time
+import logging
 
-# 添加项目根目录到Python路径
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+# 币安客户端模块 src.core.binance_client 目前不在仓库中，缺失时整个模块跳过
+binance_client = pytest.importorskip(
+    "src.core.binance_client", reason="src.core.binance_client 不存在"
+).binance_client
 
-from src.core.binance_client import binance_client
-from src.config.config_manager import config_manager
-
-
-# 简化的Stock和MarketData类用于测试
-class Stock:
-    def __init__(self):
-        self.symbol = ""
-        self.name = ""
-        self.current_price = 0.0
-        self.open_price = 0.0
-        self.high_price = 0.0
-        self.low_price = 0.0
-        self.volume = 0
-        self.price_history = []
-
-
-class MarketData:
-    def __init__(self):
-        self.stocks = {}
-    
-    def add_stock(self, stock):
-        self.stocks[stock.symbol] = stock
-    
-    def update_price(self, symbol, new_price):
-        if symbol in self.stocks:
-            stock = self.stocks[symbol]
-            stock.current_price = new_price
-            stock.price_history.append(new_price)
-            stock.high_price = max(stock.high_price, new_price)
-            stock.low_price = min(stock.low_price, new_price)
+from ._helpers import TEST_SYMBOLS
 
+logger = logging.getLogger(__name__)
 
 @pytest.mark.binance
 @pytest.mark.integration
@@ -51,157 +22,128 @@ class MarketData:
 class TestBinanceIntegration:
     """币安集成测试类"""
     
-    def setup_method(self):
-        """每个测试方法执行前的设置"""
-        self.market_data = MarketData()
-        self.test_symbols = ['BTCUSDT', 'ETHUSDT', 'BNBUSDT']
-    
     @pytest.mark.unit
-    def test_binance_client_basic(self):
+    def test_binance_client_basic(self, cached_prices, cached_symbol_price):
         """测试币安客户端基本功能"""
-        print("🔍 测试币安客户端...")
+        logger.debug("🔍 测试币安客户端...")
         
         # 测试连接
-        print(f"币安客户端启用状态: {binance_client.is_enabled()}")
-        print(f"支持的交易对: {binance_client.get_supported_symbols()}")
+        logger.debug("币安客户端启用状态: %s", binance_client.is_enabled())
+        logger.debug("支持的交易对: %s", binance_client.get_supported_symbols())
         
         # 验证客户端状态
         assert binance_client is not None, "币安客户端应该已初始化"
         
         # 测试获取单个价格
-        btc_price = binance_client.get_symbol_price('BTCUSDT')
+        btc_price = cached_symbol_price('BTCUSDT')
         assert btc_price > 0, "BTC价格应该大于0"
-        print(f"✅ BTCUSDT当前价格: ${btc_price:.2f}")
+        logger.debug("✅ BTCUSDT当前价格: $%.2f", btc_price)
         
         # 测试获取多个价格
-        prices = binance_client.get_all_prices()
+        prices = cached_prices()
         assert len(prices) > 0, "应该能获取到价格数据"
-        print(f"✅ 获取到 {len(prices)} 个交易对的价格")
+        logger.debug("✅ 获取到 %d 个交易对的价格", len(prices))
     
     @pytest.mark.integration
-    def test_price_engine_integration(self):
+    @pytest.mark.parametrize("symbol", TEST_SYMBOLS)
+    def test_price_engine_integration(self, seeded_market, cached_prices, symbol):
         """测试价格引擎集成"""
-        print("🔧 测试价格引擎集成...")
-        
-        # 创建测试股票
-        for symbol in self.test_symbols:
-            stock = Stock()
-            stock.symbol = symbol
-            stock.name = symbol.replace('USDT', '/USDT')
-            self.market_data.add_stock(stock)
+        logger.debug("🔧 测试价格引擎集成...")
         
         # 更新价格
-        for symbol in self.test_symbols:
-            try:
-                current_price = binance_client.get_symbol_price(symbol)
-                self.market_data.update_price(symbol, current_price)
-                
-                stock = self.market_data.stocks[symbol]
-                assert stock.current_price == current_price, f"{symbol}价格更新失败"
-                assert len(stock.price_history) > 0, f"{symbol}价格历史应该有数据"
-                print(f"✅ {symbol}: ${current_price:.4f}")
-                
-            except Exception as e:
-                pytest.fail(f"更新{symbol}价格失败: {e}")
+        current_price = cached_prices()[symbol]
+        seeded_market.update_price(symbol, current_price)
         
-        print(f"✅ 成功更新 {len(self.test_symbols)} 个交易对的价格")
+        stock = seeded_market.stocks[symbol]
+        assert stock.current_price == current_price, f"{symbol}价格更新失败"
+        assert stock.price_history == [current_price], f"{symbol}价格历史应只有本次更新"
+        logger.debug("✅ %s: $%.4f", symbol, current_price)
     
     @pytest.mark.network
-    def test_kline_data_integration(self):
+    @pytest.mark.parametrize("symbol", TEST_SYMBOLS[:2])  # 只测试前两个，避免过多API调用
+    def test_kline_data_integration(self, symbol):
         """测试K线数据集成"""
-        print("📊 测试K线数据集成...")
-        
-        for symbol in self.test_symbols[:2]:  # 只测试前两个，避免过多API调用
-            try:
-                klines = binance_client.get_klines(symbol, '1h', 10)
-                assert len(klines) > 0, f"应该能获取到{symbol}的K线数据"
-                
-                # 验证K线数据结构
-                for kline in klines:
-                    assert 'open' in kline, "K线数据应该包含开盘价"
-                    assert 'close' in kline, "K线数据应该包含收盘价"
-                    assert 'high' in kline, "K线数据应该包含最高价"
-                    assert 'low' in kline, "K线数据应该包含最低价"
-                    assert 'volume' in kline, "K线数据应该包含成交量"
-                    
-                    # 验证价格数据合理性（基本检查）
-                    assert kline['open'] > 0, "开盘价应该大于0"
-                    assert kline['close'] > 0, "收盘价应该大于0"
-                    assert kline['high'] > 0, "最高价应该大于0"
-                    assert kline['low'] > 0, "最低价应该大于0"
-                    assert kline['volume'] >= 0, "成交量应该不小于0"
-                    
-                    # 对于真实数据，验证价格关系；对于模拟数据，可能不完全符合
-                    # 这里只做基本的合理性检查
-                    if kline['high'] < kline['open'] or kline['high'] < kline['close']:
-                        print(f"⚠️  注意：{symbol} K线数据可能是模拟数据，最高价小于开盘价或收盘价")
-                    if kline['low'] > kline['open'] or kline['low'] > kline['close']:
-                        print(f"⚠️  注意：{symbol} K线数据可能是模拟数据，最低价大于开盘价或收盘价")
-                
-                print(f"✅ {symbol}: 获取到 {len(klines)} 条K线数据")
-                
-            except Exception as e:
-                pytest.fail(f"获取{symbol}K线数据失败: {e}")
+        logger.debug("📊 测试K线数据集成...")
+        
+        klines = binance_client.get_klines(symbol, '1h', 10)
+        assert len(klines) > 0, f"应该能获取到{symbol}的K线数据"
+        
+        # 验证K线数据结构
+        for kline in klines:
+            assert 'open' in kline, "K线数据应该包含开盘价"
+            assert 'close' in kline, "K线数据应该包含收盘价"
+            assert 'high' in kline, "K线数据应该包含最高价"
+            assert 'low' in kline, "K线数据应该包含最低价"
+            assert 'volume' in kline, "K线数据应该包含成交量"
+            
+            # 验证价格数据合理性（基本检查）
+            assert kline['open'] > 0, "开盘价应该大于0"
+            assert kline['close'] > 0, "收盘价应该大于0"
+            assert kline['high'] > 0, "最高价应该大于0"
+            assert kline['low'] > 0, "最低价应该大于0"
+            assert kline['volume'] >= 0, "成交量应该不小于0"
+            
+            # 对于真实数据，验证价格关系；对于模拟数据，可能不完全符合
+            # 这里只做基本的合理性检查
+            if kline['high'] < kline['open'] or kline['high'] < kline['close']:
+                logger.debug("⚠️  注意：%s K线数据可能是模拟数据，最高价小于开盘价或收盘价", symbol)
+            if kline['low'] > kline['open'] or kline['low'] > kline['close']:
+                logger.debug("⚠️  注意：%s K线数据可能是模拟数据，最低价大于开盘价或收盘价", symbol)
+        
+        logger.debug("✅ %s: 获取到 %d 条K线数据", symbol, len(klines))
     
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_full_integration_workflow(self):
+    def test_full_integration_workflow(self, seeded_market, cached_prices, test_symbols):
         """测试完整集成工作流"""
-        print("🚀 测试完整集成工作流...")
+        logger.debug("🚀 测试完整集成工作流...")
         
-        # 1. 初始化市场数据
-        for symbol in self.test_symbols:
-            stock = Stock()
-            stock.symbol = symbol
-            stock.name = symbol.replace('USDT', '/USDT')
-            self.market_data.add_stock(stock)
+        # 1. 市场数据由 seeded_market 初始化
         
         # 2. 批量获取价格并更新
-        all_prices = binance_client.get_all_prices()
+        all_prices = cached_prices()
         assert len(all_prices) > 0, "应该能获取到批量价格数据"
         
         updated_count = 0
-        for symbol in self.test_symbols:
+        for symbol in test_symbols:
             if symbol in all_prices:
                 price = all_prices[symbol]
-                self.market_data.update_price(symbol, price)
+                seeded_market.update_price(symbol, price)
                 updated_count += 1
-                print(f"  {symbol}: ${price:.4f}")
+                logger.debug("  %s: $%.4f", symbol, price)
         
         assert updated_count > 0, "至少应该更新一个交易对的价格"
-        print(f"✅ 批量更新了 {updated_count} 个交易对的价格")
+        logger.debug("✅ 批量更新了 %d 个交易对的价格", updated_count)
         
         # 3. 验证数据完整性
-        for symbol in self.test_symbols:
-            if symbol in self.market_data.stocks:
-                stock = self.market_data.stocks[symbol]
+        for symbol in test_symbols:
+            if symbol in seeded_market.stocks:
+                stock = seeded_market.stocks[symbol]
                 assert stock.current_price > 0, f"{symbol}当前价格应该大于0"
                 assert len(stock.price_history) > 0, f"{symbol}应该有价格历史"
         
-        # 4. 模拟价格监控
-        print("📈 模拟价格监控...")
-        time.sleep(1)  # 短暂等待
-        
-        # 再次获取价格进行比较
-        for symbol in self.test_symbols[:2]:  # 只测试前两个
+        # 4. 模拟价格监控：再次获取价格进行比较
+        logger.debug("📈 模拟价格监控...")
+        new_prices = cached_prices(ttl=0)  # 监控需要最新价格，不使用缓存
+        for symbol in test_symbols[:2]:  # 只测试前两个
             try:
-                new_price = binance_client.get_symbol_price(symbol)
-                old_price = self.market_data.stocks[symbol].current_price
+                new_price = new_prices[symbol]
+                old_price = seeded_market.stocks[symbol].current_price
                 
-                self.market_data.update_price(symbol, new_price)
+                seeded_market.update_price(symbol, new_price)
                 
                 price_change = ((new_price - old_price) / old_price) * 100
-                print(f"  {symbol}: ${old_price:.4f} -> ${new_price:.4f} ({price_change:+.2f}%)")
+                logger.debug("  %s: $%.4f -> $%.4f (%+.2f%%)", symbol, old_price, new_price, price_change)
                 
             except Exception as e:
-                print(f"  {symbol}: 价格监控更新失败 - {e}")
+                logger.warning("  %s: 价格监控更新失败 - %s", symbol, e)
         
-        print("✅ 完整集成工作流测试完成")
+        logger.debug("✅ 完整集成工作流测试完成")
     
     @pytest.mark.unit
     def test_error_handling(self):
         """测试错误处理"""
-        print("⚠️  测试错误处理...")
+        logger.debug("⚠️  测试错误处理...")
         
         # 测试无效交易对
         try:
@@ -212,29 +154,29 @@ class TestBinanceIntegration:
             # 抛出异常也是正常的错误处理
             pass
         
-        print("✅ 错误处理测试完成")
+        logger.debug("✅ 错误处理测试完成")
 
 
 @pytest.fixture(scope="class")
 def integration_test_setup():
     """类级别的fixture，用于集成测试设置"""
-    print("\n🔧 设置币安集成测试环境...")
+    logger.debug("🔧 设置币安集成测试环境...")
     yield
-    print("🧹 清理币安集成测试环境...")
+    logger.debug("🧹 清理币安集成测试环境...")
 
 
 @pytest.mark.integration
 def test_integration_summary():
     """集成测试总结"""
-    print("\n" + "=" * 60)
-    print("📋 币安集成测试总结")
-    print("=" * 60)
-    print("✅ 币安客户端基本功能正常")
-    print("✅ 价格引擎集成正常")
-    print("✅ K线数据获取正常")
-    print("✅ 完整工作流测试通过")
-    print("✅ 错误处理机制正常")
-    print("🎉 所有集成测试完成！")
+    logger.info("=" * 60)
+    logger.info("📋 币安集成测试总结")
+    logger.info("=" * 60)
+    logger.info("✅ 币安客户端基本功能正常")
+    logger.info("✅ 价格引擎集成正常")
+    logger.info("✅ K线数据获取正常")
+    logger.info("✅ 完整工作流测试通过")
+    logger.info("✅ 错误处理机制正常")
+    logger.info("🎉 所有集成测试完成！")
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 import sys
 import os
+import re
+import traceback
 
 from src.sandbox import (
     run_environment_safely,
@@ -11,6 +13,49 @@ from src.sandbox import (
     exec_bash,
 )
 
+# 所有沙箱共用的 pip 缓存目录，重复运行时已下载的依赖无需重新下载
+WHEEL_CACHE = os.path.expanduser("~/.cache/sandbox_wheels")
+os.makedirs(WHEEL_CACHE, exist_ok=True)
+
+
+BATCH_SEP = "__BATCH_SEP__"
+# 只匹配整行的分隔符，exec_bash 的调试输出中回显的脚本内容不会误匹配
+_BATCH_SEP_RE = re.compile(rf"^{BATCH_SEP} (-?\d+)$", re.M)
+
+
+def _split_batch_output(text, count):
+    """按分隔行拆分批量命令的输出，返回 [(退出码, 输出)]"""
+    parts = []
+    pos = 0
+    for match in _BATCH_SEP_RE.finditer(text):
+        parts.append((int(match.group(1)), text[pos:match.start()]))
+        pos = match.end() + 1
+    # 批量脚本中途超时时，剩余命令没有分隔行
+    if len(parts) < count:
+        parts.append((-1, text[pos:]))
+    parts.extend((-1, "") for _ in range(count - len(parts)))
+    return parts[:count]
+
+
+def batch_bash(session_id, commands, timeout=30):
+    """把多条互不依赖的命令合并为一次 exec_bash 调用
+
+    每条命令在子shell中执行，之后向 stdout 和 stderr 各写一行分隔符及退出码，
+    返回与 exec_bash 结果相同形状的字典列表
+    """
+    script = "\n".join(
+        f'(\n{cmd}\n)\nrc=$?; echo "{BATCH_SEP} $rc"; echo "{BATCH_SEP} $rc" >&2'
+        for cmd in commands
+    )
+    result = exec_bash(session_id, script, timeout=timeout)
+    stdout_parts = _split_batch_output(result.get('stdout', ''), len(commands))
+    stderr_parts = _split_batch_output(result.get('stderr', ''), len(commands))
+    return [
+        {'success': rc == 0, 'stdout': out, 'stderr': err}
+        for (rc, out), (_, err) in zip(stdout_parts, stderr_parts)
+    ]
+
+
 if __name__ == "__main__":
     import json
     import os
@@ -20,6 +65,16 @@ if __name__ == "__main__":
     print("=" * 60)
     print(" Python 代码安全执行环境测试")
     print("=" * 60)
+
+    # 测试8-12共用一个长生命周期会话：venv 只创建一次，已装的包在测试间复用，
+    # 全部测试结束后统一清理。测试1-7仍在下方禁用的字符串块中
+    GLOBAL_SESSION = None
+    try:
+        GLOBAL_SESSION = create_true_sandbox(timeout_minutes=30, debug=True, pip_cache_dir=WHEEL_CACHE, use_uv=True)
+        print(f" 共享会话创建成功，ID: {GLOBAL_SESSION.session_id}")
+    except Exception as e:
+        print(f" 共享会话创建失败: {e}")
+        traceback.print_exc()
     """
     # 方式1：一次性执行（保持不变）
     print("\n【测试1：一次性执行】")
@@ -399,15 +454,7 @@ print("极限依赖测试完成!")
     print("=" * 60)
 """
     # 测试8：Bash基础功能测试
-    session = None
-    try:
-        print(" 创建测试会话...")
-        session = create_true_sandbox(timeout_minutes=10, debug=True)
-        print(f" 会话创建成功，ID: {session.session_id}")
-    except Exception as e:
-        print(f" 会话创建失败: {e}")
-        import traceback
-        traceback.print_exc()
+    session = GLOBAL_SESSION
 
 
     print("\n【测试8：Bash基础功能测试】")
@@ -427,7 +474,6 @@ print("极限依赖测试完成!")
             
         except Exception as e:
             print(f" Bash基础测试失败: {e}")
-            import traceback
             traceback.print_exc()
     else:
         print(" 跳过：无可用会话")
@@ -464,7 +510,6 @@ except Exception as e:
             
         except Exception as e:
             print(f" 混合使用测试失败: {e}")
-            import traceback
             traceback.print_exc()
     else:
         print(" 跳过：无可用会话")
@@ -478,7 +523,8 @@ except Exception as e:
             
             # 用bash安装包
             print(" 用bash安装requests包...")
-            result = exec_bash(session_id, 'pip install requests', timeout=120)
+            # 有 uv 时优先用 uv 安装（会话的 venv 已激活，uv 会装到该 venv 中）
+            result = exec_bash(session_id, 'if command -v uv >/dev/null; then uv pip install -q requests; else pip install -q requests; fi', timeout=120)
             print(f" pip安装结果:")
             print(f"   输出: '{result.get('stdout', 'NO_OUTPUT')[:200]}...'")  # 截断长输出
             print(f"   成功: {result.get('success', False)}")
@@ -493,7 +539,6 @@ except Exception as e:
             
         except Exception as e:
             print(f" Bash安装包测试失败: {e}")
-            import traceback
             traceback.print_exc()
     else:
         print(" 跳过：无可用会话")
@@ -534,7 +579,6 @@ echo -e "\\n=== 脚本执行完成 ==="
             
         except Exception as e:
             print(f" 复杂脚本测试失败: {e}")
-            import traceback
             traceback.print_exc()
     else:
         print(" 跳过：无可用会话")
@@ -623,8 +667,10 @@ echo -e "\\n=== 脚本执行完成 ==="
                 ("系统信息", "uname -a")
             ]
             
-            for desc, cmd in dangerous_commands:
-                result = exec_bash(session_id, cmd, timeout=5)
+            # 五条命令一次提交，每条仍按原来的5秒预算计算总超时
+            results = batch_bash(session_id, [cmd for _, cmd in dangerous_commands],
+                                 timeout=5 * len(dangerous_commands))
+            for (desc, cmd), result in zip(dangerous_commands, results):
                 success = result.get('success', False)
                 output = result.get('stdout', '').strip()[:50] + "..." if len(result.get('stdout', '')) > 50 else result.get('stdout', '').strip()
                 error = result.get('stderr', '').strip()[:50] + "..." if len(result.get('stderr', '')) > 50 else result.get('stderr', '').strip()
@@ -645,7 +691,11 @@ echo -e "\\n=== 脚本执行完成 ==="
             
         except Exception as e:
             print(f" Bash沙箱环境验证失败: {e}")
-            import traceback
             traceback.print_exc()
     else:
         print(" 跳过：无可用会话")
+
+    if GLOBAL_SESSION is not None:
+        print(f"\n清理共享会话: {GLOBAL_SESSION.session_id[:8]}...")
+        cleanup_sandbox_session(GLOBAL_SESSION.session_id)
+        print("清理完成")
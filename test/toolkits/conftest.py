@@ -0,0 +1,105 @@
+"""
+toolkits 测试共用的 fixtures
+
+沙箱的创建（新建 venv、启动常驻进程）是这些测试的主要耗时。整个测试会话只创建
+一个沙箱会话和 SandboxToolkit，每个测试在其中使用独立的子目录，互不干扰。
+只检查工具定义的测试标记为 nobootstrap，使用不创建沙箱的 offline_toolkit。
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+import qbot.toolkits.sandbox_toolkit as sandbox_toolkit_mod
+from qbot.sandbox import create_persistent_sandbox
+from qbot.toolkits.sandbox_toolkit import SandboxToolkit
+
+
+class WorkdirSandbox:
+    """把文件路径和命令限定在共享沙箱某个子目录内的轻量包装"""
+
+    def __init__(self, toolkit, session_root, workdir):
+        self.toolkit = toolkit
+        self.workdir = workdir
+        self.abs_workdir = os.path.join(session_root, workdir)
+
+    def path(self, file_path):
+        return f"{self.workdir}/{file_path}"
+
+    def file_tool(self, action, file_path, content=None):
+        return self.toolkit.file_tool(action, self.path(file_path), content)
+
+    def run_code(self, code, env_requirements=None):
+        # 常驻进程的当前目录会延续到后续调用，每次执行前都切回本测试的子目录
+        prefix = f"import os as _os\n_os.chdir({self.abs_workdir!r})\n"
+        return self.toolkit.run_code(prefix + code, env_requirements)
+
+    def run_bash(self, bash_cmd, env_requirements=None):
+        return self.toolkit.run_bash(f"cd {self.workdir} && {bash_cmd}", env_requirements)
+
+
+TOOLKITS_DIR = Path(__file__).resolve().parent
+
+
+def pytest_collection_modifyitems(config, items):
+    """本目录的 nobootstrap 测试排到本目录其他测试之前，它们失败时不必先等沙箱启动
+
+    只在本目录测试原来占据的位置之间重排（排序稳定），其他目录的测试顺序不受影响
+    """
+    positions = [i for i, item in enumerate(items) if TOOLKITS_DIR in item.path.resolve().parents]
+    ordered = sorted((items[i] for i in positions),
+                     key=lambda item: item.get_closest_marker("nobootstrap") is None)
+    for i, item in zip(positions, ordered):
+        items[i] = item
+
+
+@pytest.fixture(autouse=True)
+def _guard_nobootstrap(request, monkeypatch):
+    """标记为 nobootstrap 的测试一旦触发沙箱创建就直接失败"""
+    if request.node.get_closest_marker("nobootstrap") is None:
+        return
+    
+    def _fail(*args, **kwargs):
+        # pytest.fail 抛出的不是 Exception 子类，不会被工具方法里的 except 吞掉
+        pytest.fail("nobootstrap 测试不应创建沙箱")
+    
+    monkeypatch.setattr(sandbox_toolkit_mod, "create_persistent_sandbox", _fail)
+
+
+@pytest.fixture
+def offline_toolkit():
+    """不创建沙箱的 SandboxToolkit，只用于检查工具定义"""
+    return SandboxToolkit(
+        default_file_map={},
+        default_requirements=[],
+        bootstrap_on_init=False,
+    )
+
+
+@pytest.fixture(scope="session")
+def sandbox_session():
+    """整个测试会话共用的持久化沙箱"""
+    session = create_persistent_sandbox(memory_limit_mb=256, timeout_minutes=30)
+    yield session
+    session.cleanup()
+
+
+@pytest.fixture(scope="session")
+def shared_sandbox(sandbox_session):
+    """复用共享沙箱的 SandboxToolkit，不上传默认文件也不安装默认依赖"""
+    return SandboxToolkit(
+        session=sandbox_session,
+        default_file_map={},
+        default_requirements=[],
+        on_bootstrap_error="raise",
+    )
+
+
+@pytest.fixture
+def sandbox(shared_sandbox, sandbox_session, tmp_path):
+    """每个测试在共享沙箱中独占的子目录"""
+    workdir = f"tests/{tmp_path.name}"
+    result = shared_sandbox.run_bash(f"mkdir -p {workdir}")
+    assert result["success"], result
+    return WorkdirSandbox(shared_sandbox, sandbox_session.work_dir, workdir)
@@ -1,7 +1,7 @@
 import os
 import sys
 
-from src.toolkits.function_tool import FunctionTool
+from qbot.toolkits.function_tool import FunctionTool
 
 # 1) A plain Python function
 def web_search(query: str, k: int = 5) -> str:
@@ -12,25 +12,27 @@
 import os
 import sys
 import argparse
+import hashlib
 import tempfile
 from textwrap import dedent
 from pprint import pprint
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-sys.path.insert(0, PROJECT_ROOT)
 
-# Adjust this import if your module path differs
-import src.toolkits.player_env_toolkit as pet_mod
-from src.toolkits.sandbox_toolkit import SandboxToolkit
-from src.models import BaseModelBackend
-from src.models import ModelFactory
-from src.types import ModelPlatformType,ModelType
+# Toolkit and model modules are imported inside main(): importing this file
+# (e.g. during pytest collection) stays stdlib-only and builds no API client.
 
-single_model = ModelFactory.create(
-    model_platform=ModelPlatformType.OPENAI,
-    model_type=ModelType.GPT_4O_MINI,
-    model_config_dict={"temperature": 0},
-)
+
+def create_model():
+    """Build the model backend used by PlayerEnvToolkit."""
+    from qbot.models import ModelFactory
+    from qbot.types import ModelPlatformType, ModelType
+
+    return ModelFactory.create(
+        model_platform=ModelPlatformType.OPENAI,
+        model_type=ModelType.GPT_4O_MINI,
+        model_config_dict={"temperature": 0},
+    )
 
 # -------------------------- helpers to synthesize files --------------------------
 
@@ -45,8 +47,13 @@ def ensure_host_llm_stub():
     return llm_path
 
 
-def make_temp_player_py(path: str) -> None:
-    """Create a minimal player that honors --env-file/--env-class/--max-steps."""
+def make_temp_player_py() -> str:
+    """Create a minimal player that honors --env-file/--env-class/--max-steps.
+
+    The file is named after a hash of its content in the system temp dir, so
+    repeated runs reuse it instead of writing a new copy each time.
+    Returns the host path of the player script.
+    """
     code = dedent(r"""
         import argparse, importlib.util, json
 
@@ -100,9 +107,13 @@ def make_temp_player_py(path: str) -> None:
         if __name__ == "__main__":
             main()
     """)
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(code)
+    data = code.encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    path = os.path.join(tempfile.gettempdir(), f"pet_player_{digest}.py")
+    if not (os.path.exists(path) and os.path.getsize(path) == len(data)):
+        with open(path, "wb") as f:
+            f.write(data)
+    return path
 
 
 def default_env_code() -> str:
@@ -179,6 +190,10 @@ def build_argparser() -> argparse.ArgumentParser:
 def main():
     args = build_argparser().parse_args()
 
+    # Adjust this import if your module path differs
+    import qbot.toolkits.player_env_toolkit as pet_mod
+    from qbot.toolkits.sandbox_toolkit import SandboxToolkit
+
     # Ensure utils/llm.py exists on host unless user already mapped one
     mapped_llm = any(dest == "utils/llm.py" for _, dest in args.map)
     if not mapped_llm:
@@ -188,10 +203,7 @@ def main():
     if args.player_host:
         pet_mod.BENCHMARK_FILE_PATH[args.benchmark] = args.player_host
     else:
-        tmp_dir = tempfile.mkdtemp(prefix="pet_player_")
-        host_player_path = os.path.join(tmp_dir, "dummy_player.py")
-        make_temp_player_py(host_player_path)
-        pet_mod.BENCHMARK_FILE_PATH[args.benchmark] = host_player_path
+        pet_mod.BENCHMARK_FILE_PATH[args.benchmark] = make_temp_player_py()
 
     # Create sandbox toolkit with safe defaults
     sandbox = SandboxToolkit(
@@ -207,7 +219,7 @@ def main():
     pet = pet_mod.PlayerEnvToolkit(
         benchmark_type=args.benchmark,
         sandbox_toolkit=sandbox,
-        model=single_model,
+        model=create_model(),
         env_requirements=reqs,
         default_workdir=args.workdir,
     )
@@ -221,16 +233,13 @@ def main():
         if not res.get("success", False):
             raise RuntimeError(f"File import failed: {res.get('error')}")
 
-    # If the specified env file does not exist in the sandbox, write a default one
-    check_res = sandbox.code_tool(
-        action="run_bash",
-        bash_cmd=f"test -f {args.env_in_sandbox} && echo EXIST || echo MISSING"
-    )
-    exists_flag = "EXIST" in (check_res.get("stdout") or "")
+    # If the specified env file does not exist in the sandbox, write a default one.
+    # stat/save are served on the host side, so no shell is spawned in the sandbox.
+    exists_flag = sandbox.file_tool("stat", args.env_in_sandbox).get("exists", False)
     if not exists_flag:
         print(f"\nEnvironment '{args.env_in_sandbox}' not found in sandbox; writing default env.")
         save_res = sandbox.file_tool("save", args.env_in_sandbox, default_env_code())
-        assert save_res.get("success") is True, f"Failed to write default env: {save_res}"
+        assert save_res.get("success"), f"Failed to write default env: {save_res}"
 
     # Run the player
     result = pet.play_env(file_path=args.env_in_sandbox, step_limit=args.step_limit)
@@ -255,4 +264,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Under pytest the import path comes from pytest.ini; only a direct run needs it
+    sys.path.insert(0, PROJECT_ROOT)
     main()
\ No newline at end of file
@@ -1,88 +1,84 @@
 # tests/test_sandbox_toolkit.py
 # ------------------------------------------------------------
-# Minimal smoke test for SandboxToolkit + FunctionTool.
-# It prints the OpenAI tool schemas and executes a few calls.
+# Smoke tests for SandboxToolkit + FunctionTool.
+# Schema tests come first and never start a sandbox (nobootstrap);
+# the execution tests share one sandbox session (see conftest.py),
+# each working in its own sub-directory of that sandbox.
 # ------------------------------------------------------------
 
-import os
-import sys
-from pprint import pprint
-from pprint import PrettyPrinter
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
-sys.path.insert(0, project_root)
+import pytest
 
-from src.toolkits.sandbox_toolkit import SandboxToolkit
+SAMPLE_TEXT = "Hello from SandboxToolkit!\nLine 2."
 
 
+@pytest.mark.nobootstrap
+def test_get_tools_exposes_high_level_apis(offline_toolkit):
+    tools = offline_toolkit.get_tools()
+    tool_by_name = {t.get_function_name(): t for t in tools}
+    assert set(tool_by_name) == {"file_tool", "run_code", "run_bash"}
 
-def main():
-    # 1) Create the toolkit.
-    #    Override defaults so the test doesn't try to upload missing files or install packages.
-    toolkit = SandboxToolkit(
-        default_file_map={},          # avoid uploading non-existent files
-        default_requirements=[],      # avoid default pip installs
-        bootstrap_on_init=False,      # bootstrap lazily at first call
-        memory_limit_mb=256,
-        timeout_minutes=3,
-    )
+    # These schemas can be passed to LLMs as `tools=[...]`
+    for tool in tools:
+        schema = tool.get_openai_tool_schema()
+        assert schema["type"] == "function"
+        assert schema["function"]["parameters"]["properties"]
 
-    # 2) Get the two tools (file_tool, code_tool) as FunctionTool objects
-    tools = toolkit.get_tools()
-    assert len(tools) == 2, f"Expected 2 tools, got {len(tools)}"
 
-    # Map by function name for convenience
-    tool_by_name = {t.get_function_name(): t for t in tools}
-    file_tool = tool_by_name["file_tool"]
-    code_tool = tool_by_name["code_tool"]
-
-    # 3) Print OpenAI tool schemas (these can be passed to LLMs as `tools=[...]`)
-    print("\n=== OpenAI Tool Schemas ===")
-    PrettyPrinter(width=200, compact=True).pprint(file_tool.get_openai_tool_schema())
-    PrettyPrinter(width=200, compact=True).pprint(code_tool.get_openai_tool_schema())
-
-    # 4) Exercise file_tool: save then read
-    print("\n=== file_tool: save ===")
-    save_res = file_tool(
-        "save",
-        "tmp/test_sandbox_toolkit.txt",
-        "Hello from SandboxToolkit!\nLine 2.",
-    )
-    pprint(save_res)
-
-    print("\n=== file_tool: read ===")
-    read_res = file_tool("read", "tmp/test_sandbox_toolkit.txt")
-    pprint(read_res)
-
-    # 5) Exercise code_tool: run Python code that reads the file and prints its content
-    print("\n=== code_tool: run_code (Python) ===")
+@pytest.mark.nobootstrap
+def test_run_code_requires_code(offline_toolkit):
+    # Argument validation happens before the sandbox is touched
+    res = offline_toolkit.run_code(code="")
+    assert res["success"] is False
+    assert res["returncode"] == -1
+
+
+def test_file_tool_save_and_read(sandbox):
+    save_res = sandbox.file_tool("save", "tmp/test_sandbox_toolkit.txt", SAMPLE_TEXT)
+    assert save_res["success"] is True
+
+    read_res = sandbox.file_tool("read", "tmp/test_sandbox_toolkit.txt")
+    assert read_res["success"] is True
+    assert read_res["content"] == SAMPLE_TEXT
+    assert read_res["full_length"] == len(SAMPLE_TEXT)
+
+
+def test_file_tool_stat(sandbox):
+    assert sandbox.file_tool("stat", "tmp/missing.txt") == {"success": True, "exists": False}
+
+    sandbox.file_tool("save", "tmp/test_sandbox_toolkit.txt", SAMPLE_TEXT)
+    res = sandbox.file_tool("stat", "tmp/test_sandbox_toolkit.txt")
+    assert res["success"] is True
+    assert res["exists"] is True
+    assert res["size"] == len(SAMPLE_TEXT.encode("utf-8"))
+
+
+def test_file_tool_stat_rejects_paths_outside_sandbox(sandbox):
+    res = sandbox.file_tool("stat", "../../../../../../../../etc/passwd")
+    assert res["success"] is False
+    assert "escapes sandbox" in res["error"]
+
+
+def test_file_tool_unknown_action(sandbox):
+    res = sandbox.file_tool("append", "tmp/test_sandbox_toolkit.txt", "x")
+    assert res["success"] is False
+    assert "Unknown action" in res["error"]
+
+
+def test_run_code_reads_saved_file(sandbox):
+    sandbox.file_tool("save", "tmp/test_sandbox_toolkit.txt", SAMPLE_TEXT)
     py_code = r"""
-import sys, pathlib
+import pathlib
 p = pathlib.Path("tmp/test_sandbox_toolkit.txt")
 print("File exists:", p.exists())
-if p.exists():
-    print("Content:")
-    print(p.read_text())
+print(p.read_text())
 """
-    run_code_res = code_tool(
-        "run_code",
-        code=py_code,
-        env_requirements=[],          
-    )
-    pprint(run_code_res)
-
-    # 6) Exercise code_tool: run a simple bash command
-    print("\n=== code_tool: run_bash (echo) ===")
-    run_bash_res = code_tool("run_bash", bash_cmd="echo hello_from_bash")
-    pprint(run_bash_res)
-
-    # 7) (Optional) Demonstrate FunctionTool with synthesis config (commented)
-    # synthesis = SynthesisConfig(enable_schema_synthesis=True, schema_llm=my_llm_client)
-    # file_tool_with_synth = FunctionTool(toolkit.file_tool, synthesis=synthesis)
-    # repaired_schema = file_tool_with_synth.get_openai_tool_schema()
-    # pprint(repaired_schema)
-
-    print("\nAll SandboxToolkit smoke tests completed.")
+    res = sandbox.run_code(py_code, env_requirements=[])
+    assert res["success"] is True, res
+    assert "File exists: True" in res["stdout"]
+    assert "Line 2." in res["stdout"]
 
 
-if __name__ == "__main__":
-    main()
\ No newline at end of file
+def test_run_bash_echo(sandbox):
+    res = sandbox.run_bash("echo hello_from_bash")
+    assert res["success"] is True, res
+    assert "hello_from_bash" in res["stdout"]
@@ -1,93 +1,87 @@
 import pytest
 import os
-import sys
-import tempfile
+import json
+import math
 import shutil
+import importlib.util
 
-# 计算项目根路径并添加到 sys.path
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
-sys.path.insert(0, project_root)
+from qbot.utils.file_system.handlers import structured_handler
+from qbot.utils.file_system.handlers.structured_handler import StructuredFileHandler
 
-from src.file_system.handlers.structured_handler import StructuredFileHandler
-
-@pytest.fixture
+# 处理器无状态，整个模块共用一个实例和一个临时目录，
+# 各测试以测试名作文件名，互不覆盖
+@pytest.fixture(scope="module")
 def handler():
     return StructuredFileHandler()
 
-@pytest.fixture
-def temp_dir():
-    dir_path = tempfile.mkdtemp()
+@pytest.fixture(scope="module")
+def temp_dir(tmp_path_factory):
+    # 临时目录位于内存文件系统，文件占用的就是内存；模块结束即删除，
+    # 不必等 pytest 按保留次数清理
+    dir_path = str(tmp_path_factory.mktemp("structured"))
     yield dir_path
-    shutil.rmtree(dir_path)
+    # 目录里只有平铺的测试文件，逐个删除比 rmtree 少做 stat；意外出现子目录时退回 rmtree
+    try:
+        for entry in os.scandir(dir_path):
+            os.unlink(entry.path)
+        os.rmdir(dir_path)
+    except OSError:
+        shutil.rmtree(dir_path, ignore_errors=True)
 
-def test_json_read_write(handler, temp_dir):
-    file_path = os.path.join(temp_dir, 'test.json')
-    content = {'key': 'value'}
-    assert handler.write(file_path, content)
-    assert os.path.exists(file_path)
-    read_content = handler.read(file_path)
-    assert isinstance(read_content, str)
-    assert 'key: value' in read_content
+# 只检查是否安装，不在收集阶段导入 openpyxl
+_HAS_OPENPYXL = importlib.util.find_spec("openpyxl") is not None
 
-def test_jsonl_read_write(handler, temp_dir):
-    file_path = os.path.join(temp_dir, 'test.jsonl')
-    content = [{'key': 'value1'}, {'key': 'value2'}]
-    assert handler.write(file_path, content)
-    assert os.path.exists(file_path)
-    read_content = handler.read(file_path)
-    assert isinstance(read_content, str)
-    assert 'key: value1' in read_content
+# (扩展名, 写入内容, 读出的 Markdown 中应包含的片段)
+FORMAT_CASES = [
+    pytest.param('json', {'key': 'value'}, 'key: value', id='json'),
+    pytest.param('jsonl', [{'key': 'value1'}, {'key': 'value2'}], 'key: value1', id='jsonl'),
+    pytest.param('csv', [['header1', 'header2'], ['data1', 'data2']], '- header1', id='csv'),
+    pytest.param('xlsx', [{'header1': 'data1', 'header2': 'data2'}], 'header1: data1', id='xlsx',
+                 marks=pytest.mark.skipif(not _HAS_OPENPYXL, reason="需要 openpyxl")),
+    pytest.param('xml', {'root': {'key': 'value'}}, 'root:\n    key: value', id='xml'),
+    pytest.param('yaml', {'key': 'value'}, 'key: value', id='yaml'),
+    pytest.param('toml', {'key': 'value'}, 'key: value', id='toml'),
+    pytest.param('ini', {'section': {'key': 'value'}}, 'section:\n    key: value', id='ini'),
+]
 
-def test_csv_read_write(handler, temp_dir):
-    file_path = os.path.join(temp_dir, 'test.csv')
-    content = [['header1', 'header2'], ['data1', 'data2']]
+@pytest.mark.parametrize("ext,content,needle", FORMAT_CASES)
+def test_read_write(handler, temp_dir, request, ext, content, needle):
+    file_path = os.path.join(temp_dir, f"{request.node.name}.{ext}")
     assert handler.write(file_path, content)
     assert os.path.exists(file_path)
     read_content = handler.read(file_path)
     assert isinstance(read_content, str)
-    assert '- header1' in read_content
+    assert needle in read_content
+    # 读出的是普通映射/列表，不应带 Python 对象标签
+    assert '!!python' not in read_content
 
-def test_excel_read_write(handler, temp_dir):
-    file_path = os.path.join(temp_dir, 'test.xlsx')
-    content = [{'header1': 'data1', 'header2': 'data2'}]
-    assert handler.write(file_path, content)
-    assert os.path.exists(file_path)
-    read_content = handler.read(file_path)
-    assert isinstance(read_content, str)
-    assert 'header1: data1' in read_content
 
-def test_xml_read_write(handler, temp_dir):
-    file_path = os.path.join(temp_dir, 'test.xml')
-    content = {'root': {'key': 'value'}}
-    assert handler.write(file_path, content)
-    assert os.path.exists(file_path)
-    read_content = handler.read(file_path)
-    assert isinstance(read_content, str)
-    assert 'root:\n    key: value' in read_content
+# orjson 处理不了的值：超出 64 位的整数、NaN/Infinity
+@pytest.mark.parametrize("value", [2**70, -(2**64), 18446744073709551616], ids=str)
+def test_json_big_int_round_trip(value):
+    data = {'big': value, 'items': [value]}
+    restored = structured_handler._json_loads(structured_handler._json_dumps(data))
+    assert restored == data
+    assert type(restored['big']) is int
 
-def test_yaml_read_write(handler, temp_dir):
-    file_path = os.path.join(temp_dir, 'test.yaml')
-    content = {'key': 'value'}
-    assert handler.write(file_path, content)
-    assert os.path.exists(file_path)
-    read_content = handler.read(file_path)
-    assert isinstance(read_content, str)
-    assert 'key: value' in read_content
+def test_json_non_finite_round_trip():
+    data = [1.5, float('inf'), float('-inf'), float('nan')]
+    restored = structured_handler._json_loads(structured_handler._json_dumps(data, indent=True))
+    assert restored[:3] == data[:3]
+    assert math.isnan(restored[3])
 
-def test_toml_read_write(handler, temp_dir):
-    file_path = os.path.join(temp_dir, 'test.toml')
-    content = {'key': 'value'}
-    assert handler.write(file_path, content)
-    assert os.path.exists(file_path)
+def test_read_stdlib_json_with_nan(handler, temp_dir):
+    # 旧版本用标准库 json 写出的文件中可能带有 NaN/Infinity
+    file_path = os.path.join(temp_dir, "stdlib_nan.json")
+    with open(file_path, 'w', encoding='utf-8') as fp:
+        json.dump({'nan': float('nan'), 'inf': float('inf')}, fp)
     read_content = handler.read(file_path)
-    assert isinstance(read_content, str)
-    assert 'key: value' in read_content
+    assert 'nan: .nan' in read_content
+    assert 'inf: .inf' in read_content
 
-def test_ini_read_write(handler, temp_dir):
-    file_path = os.path.join(temp_dir, 'test.ini')
-    content = {'section': {'key': 'value'}}
+def test_yaml_ambiguous_scalars_round_trip(handler, temp_dir):
+    # 写出与读回须使用同一 YAML 版本，否则 'yes'/'on' 会读成布尔值、'010' 读成八进制
+    content = {'yes': 'yes', 'on': 'on', 'octal': '010', 'exp': '1e3', 'null': 'null', 'flag': True}
+    file_path = os.path.join(temp_dir, "ambiguous.yaml")
     assert handler.write(file_path, content)
-    assert os.path.exists(file_path)
-    read_content = handler.read(file_path)
-    assert isinstance(read_content, str)
-    assert 'section:\n    key: value' in read_content
+    assert handler._read_yaml(file_path) == content
@@ -1,14 +1,8 @@
-import sys
-import os
 import pytest
 
 pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning:PyPDF2")
 
-# Adjust sys.path to include the project root
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
-sys.path.insert(0, project_root)
-
-from src.file_system.fileSystem import FileSystem, FileSystemError
+from qbot.utils.file_system.fileSystem import FileSystem, FileSystemError
 @pytest.fixture
 def filesystem(tmp_path):
     fs = FileSystem(root=tmp_path)
@@ -60,13 +54,6 @@ def test_read_file_text(filesystem):
     result = filesystem.read_file(file_path)
     assert result['content'] == content
 
-def test_read_file_structured(filesystem):
-    file_path = 'test.json'
-    content = '{"key": "value"}'
-    filesystem.save_file(file_path, content)
-    result = filesystem.read_file(file_path)
-    assert 'key: value' in result['content']  # Adjust if necessary based on actual format
-
 def test_read_file_binary(filesystem):
     file_path = 'test.bin'
     content = b'\x00\x01\x02'
@@ -78,9 +65,8 @@ def test_list_files(filesystem):
     filesystem.save_file('test1.txt', 'content1')
     filesystem.save_file('test2.json', '{"key": "value"}')
     files = filesystem.list_files()
-    assert 'test1.txt' in files
-    assert 'test2.json' in files
     assert len(files) == 2
+    assert set(files) == {'test1.txt', 'test2.json'}
 
 def test_delete_file(filesystem):
     file_path = 'test.txt'
@@ -0,0 +1,461 @@
+import pytest
+import time
+import json
+import hashlib
+import shutil
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Union
+
+
+from qbot.utils.file_system.fileSystem import FileSystem, FileSystemError
+
+
+@pytest.fixture(scope="session")
+def _tmp_root(tmp_path_factory):
+    """整个测试会话共用的父目录，由 pytest 统一清理"""
+    return tmp_path_factory.mktemp("fs_suite")
+
+
+@pytest.fixture
+def temp_dir(_tmp_root):
+    """每个测试独立的子目录，只需一次 mkdir，不逐个删除"""
+    d = _tmp_root / uuid.uuid4().hex
+    d.mkdir()
+    yield d
+
+
+@pytest.fixture
+def filesystem(temp_dir):
+    """Create a FileSystem instance with temporary directory."""
+    fs = FileSystem(root=temp_dir)
+    yield fs
+
+
+def _reset_filesystem(fs):
+    """清空根目录下除注册表外的所有文件，并把注册表重置为空"""
+    for p in fs.root.iterdir():
+        if p == fs.registry_path:
+            continue
+        if p.is_dir():
+            shutil.rmtree(p, ignore_errors=True)
+        else:
+            p.unlink()
+    fs._write_registry({})
+
+
+def _snapshot(root):
+    """一次 scandir 取得根目录下所有条目的 {名称: stat}，代替逐个路径 exists()"""
+    return {e.name: e.stat() for e in os.scandir(root)}
+
+
+@pytest.fixture(scope="module")
+def _shared_fs(tmp_path_factory):
+    """模块内共用的 FileSystem，省去每个测试重新构造各文件处理器"""
+    return FileSystem(root=tmp_path_factory.mktemp("fs"))
+
+
+@pytest.fixture
+def filesystem_fast(_shared_fs):
+    """复用同一个 FileSystem，测试前清空文件和注册表；需要自定义构造参数的测试仍用 filesystem"""
+    _reset_filesystem(_shared_fs)
+    yield _shared_fs
+
+
+@pytest.fixture
+def filesystem_nodisk():
+    """只有根路径的 FileSystem，不建目录和注册表，用于在任何 I/O 之前就报错的路径校验测试"""
+    fs = FileSystem.__new__(FileSystem)
+    fs.root = Path("/nonexistent/fs_root")
+    return fs
+
+
+@pytest.fixture(scope="class")
+def class_fs(tmp_path_factory):
+    """整个测试类共用、测试之间不清理的 FileSystem；类内各测试须使用互不相同的文件名"""
+    return FileSystem(root=tmp_path_factory.mktemp("basic"))
+
+
+def write_then_read(fs, file_path, content):
+    """保存后立即读回，返回 read_file 的结果"""
+    assert fs.save_file(file_path, content)
+    return fs.read_file(file_path)
+
+
+# 保存后原样读回的用例（文件名互不相同，可共用 class_fs）：(文件名, 写入内容, 读回内容, MIME, 需额外核对的元数据)
+ROUNDTRIP_CASES = [
+    pytest.param('test.txt', "Hello, World!\nThis is a test file.",
+                 "Hello, World!\nThis is a test file.", 'text/plain', {'size': 34}, id='text'),
+    pytest.param('data.bin', b'\x00\x01\x02\x03\xFF\xFE\xFD', 'AAECA//+/Q==',
+                 'application/octet-stream', {'has_text': True}, id='binary'),
+    pytest.param('empty.txt', '', '', 'text/plain', {'size': 0}, id='empty'),
+    pytest.param('none.txt', None, '', 'text/plain', {}, id='none'),
+    pytest.param('unicode.txt', "Hello 世界 🌍 こんにちは", "Hello 世界 🌍 こんにちは",
+                 'text/plain', {}, id='unicode'),
+]
+
+
+class TestBasicOperations:
+    """测试基础文件操作功能"""
+    
+    @pytest.mark.parametrize("file_path,content,expected,mime,meta", ROUNDTRIP_CASES)
+    def test_save_and_read_roundtrip(self, class_fs, file_path, content, expected, mime, meta):
+        """测试保存后读回内容和元数据"""
+        result = write_then_read(class_fs, file_path, content)
+        assert result['content'] == expected
+        assert result['metadata']['mime'] == mime
+        for key, value in meta.items():
+            assert result['metadata'][key] == value
+
+    def test_save_and_read_json_file(self, class_fs):
+        """测试保存和读取JSON文件"""
+        data = {"name": "test", "value": 123, "nested": {"key": "value"}}
+        result = write_then_read(class_fs, 'data.json', data)
+        # 结构化文件读出的是解析后的 YAML 形式
+        assert 'name: test' in result['content']
+        assert 'value: 123' in result['content']
+        assert result['metadata']['mime'] == 'application/json'
+
+
+class TestListFiles:
+    """测试文件列表功能"""
+    
+    def test_list_empty_filesystem(self, filesystem):
+        """测试空文件系统列表"""
+        files = filesystem.list_files()
+        assert len(files) == 0
+
+    def test_list_multiple_files(self, filesystem):
+        """测试列出多个文件"""
+        filesystem.save_file('file1.txt', 'content1')
+        filesystem.save_file('file2.json', {'key': 'value'})
+        filesystem.save_file('file3.bin', b'binary')
+        
+        files = filesystem.list_files()
+        assert len(files) == 3
+        assert set(files) == {'file1.txt', 'file2.json', 'file3.bin'}
+
+    def test_list_with_metadata(self, filesystem):
+        """测试带元数据的文件列表"""
+        filesystem.save_file('test.txt', 'content')
+        files = filesystem.list_files(with_meta=True)
+        assert len(files) == 1
+        assert files[0]['file_path'] == 'test.txt'
+        assert 'size' in files[0]
+        assert 'mime' in files[0]
+
+    def test_ignore_patterns(self, temp_dir):
+        """测试忽略模式"""
+        fs = FileSystem(root=temp_dir, ignore_patterns=['*.tmp', 'temp*'])
+        fs.save_file('normal.txt', 'content')
+        fs.save_file('temp.txt', 'content')
+        fs.save_file('file.tmp', 'content')
+        
+        files = fs.list_files()
+        assert files == ['normal.txt']
+
+
+class TestDeleteOperations:
+    """测试删除操作"""
+    
+    def test_delete_existing_file(self, filesystem):
+        """测试删除存在的文件"""
+        filesystem.save_file('to_delete.txt', 'content')
+        assert filesystem.delete_file('to_delete.txt')
+        assert not filesystem.list_files()
+        
+        with pytest.raises(FileSystemError):
+            filesystem.read_file('to_delete.txt')
+
+    def test_delete_nonexistent_file(self, filesystem):
+        """测试删除不存在的文件"""
+        assert not filesystem.delete_file('nonexistent.txt')
+
+    def test_delete_binary_file_with_description(self, filesystem):
+        """测试删除二进制文件及其描述文件"""
+        filesystem.save_file('test.bin', b'binary')
+        snap = _snapshot(filesystem.root)
+        assert 'test.bin' in snap
+        assert 'test.bin.description.txt' in snap
+        
+        assert filesystem.delete_file('test.bin')
+        snap = _snapshot(filesystem.root)
+        assert 'test.bin' not in snap
+        assert 'test.bin.description.txt' not in snap
+        assert len(filesystem.list_files()) == 0
+
+
+# 编辑测试用的 unified diff 补丁，模块级常量只构造一次
+_TEXT_PATCH = """--- a/test.txt
++++ b/test.txt
+@@ -1,3 +1,3 @@
+ line1
+-line2
++modified line2
+ line3"""
+
+_BIN_PATCH = """--- a/test.bin.description.txt
++++ b/test.bin.description.txt
+@@ -1 +1,2 @@
+ YmluYXJ5IGRhdGE=
++additional info"""
+
+_MISSING_PATCH = """--- a/nonexistent.txt
++++ b/nonexistent.txt
+@@ -0,0 +1 @@
++new content"""
+
+_BAD_PATCH = 'invalid patch format'
+
+
+class TestEditOperations:
+    """测试文件编辑功能"""
+    
+    def test_edit_text_file(self, filesystem):
+        """测试编辑文本文件"""
+        original = "line1\nline2\nline3"
+        filesystem.save_file('test.txt', original)
+        
+        result = filesystem.edit_file('test.txt', _TEXT_PATCH)
+        assert result['changed'] == True
+        
+        updated = filesystem.read_file('test.txt')
+        assert 'modified line2' in updated['content']
+
+    def test_edit_binary_description(self, filesystem):
+        """测试编辑二进制文件的描述"""
+        filesystem.save_file('test.bin', b'binary data')
+        
+        result = filesystem.edit_file('test.bin', _BIN_PATCH)
+        assert result['changed'] == True
+
+    def test_edit_nonexistent_file(self, filesystem):
+        """测试编辑不存在的文件"""
+        with pytest.raises(FileSystemError):
+            filesystem.edit_file('nonexistent.txt', _MISSING_PATCH)
+
+
+class TestSecurity:
+    """测试安全性功能"""
+    
+    def test_path_traversal_prevention(self, filesystem_nodisk):
+        """测试路径遍历攻击防护"""
+        with pytest.raises(FileSystemError, match="outside root"):
+            filesystem_nodisk.save_file('../../../etc/passwd', 'content')
+        
+        with pytest.raises(FileSystemError, match="outside root"):
+            filesystem_nodisk.read_file('../../../etc/passwd')
+        
+        with pytest.raises(FileSystemError, match="outside root"):
+            filesystem_nodisk.delete_file('../../../etc/passwd')
+
+    def test_absolute_path_handling(self, filesystem_nodisk):
+        """测试绝对路径处理"""
+        with pytest.raises(FileSystemError, match="outside root"):
+            filesystem_nodisk.save_file('/etc/passwd', 'content')
+
+    def test_path_normalization(self, filesystem):
+        """测试路径规范化"""
+        filesystem.save_file('dir/../test.txt', 'content')
+        files = filesystem.list_files()
+        assert 'test.txt' in files
+
+
+class TestMetadata:
+    """测试元数据功能"""
+    
+    def test_registry_consistency(self, filesystem_fast):
+        """测试注册表一致性"""
+        content = "test content"
+        filesystem_fast.save_file('test.txt', content)
+        
+        reg = filesystem_fast._read_registry()
+        entry = reg['test.txt']
+        
+        assert entry['file_path'] == 'test.txt'
+        assert entry['size'] == len(content)
+        assert entry['mime'] == 'text/plain'
+        assert 'content_hash' in entry
+        assert 'last_modified' in entry
+
+    def test_hash_consistency(self, filesystem_fast):
+        """测试哈希值一致性"""
+        content = "test content for hashing"
+        filesystem_fast.save_file('test.txt', content)
+        
+        reg1 = filesystem_fast._read_registry()
+        hash1 = reg1['test.txt']['content_hash']
+        
+        # 重新读取相同内容应该产生相同的哈希
+        filesystem_fast.save_file('test2.txt', content)
+        reg2 = filesystem_fast._read_registry()
+        hash2 = reg2['test2.txt']['content_hash']
+        
+        assert hash1 == hash2
+
+
+class TestLargeFiles:
+    """测试大文件处理"""
+    
+    def test_large_text_file(self, filesystem):
+        """测试大文本文件"""
+        large_content = "x" * 100000  # 100KB
+        result = write_then_read(filesystem, 'large.txt', large_content)
+        assert len(result['content']) == 100000
+
+    def test_large_binary_file(self, filesystem):
+        """测试大二进制文件"""
+        large_binary = b"x" * 50000  # 50KB
+        result = write_then_read(filesystem, 'large.bin', large_binary)
+        # 应该被base64编码
+        assert len(result['content']) > 50000
+
+    def test_register_existing_large_binary(self, filesystem):
+        """测试直接写入磁盘的大二进制文件登记到注册表，不经过 save_file 的 base64 往返"""
+        large_binary = b"x" * 50000  # 50KB
+        (filesystem.root / 'raw.bin').write_bytes(large_binary)
+        assert filesystem.register_existing('raw.bin')
+        
+        entry, = filesystem.list_files(with_meta=True)
+        assert entry['file_path'] == 'raw.bin'
+        assert entry['size'] == len(large_binary)
+        assert entry['content_hash'] == hashlib.sha256(large_binary).hexdigest()
+        assert entry['has_text'] is False
+
+    def test_register_missing_file(self, filesystem):
+        """测试登记不存在的文件"""
+        with pytest.raises(FileSystemError):
+            filesystem.register_existing('missing.bin')
+
+
+@pytest.fixture
+def warm_files(filesystem):
+    """用 save_files 一次性预建 10 个文件（注册表只写一次），返回文件名到内容的映射"""
+    files = {f'thread_{i}.txt': f"initial content {i}" for i in range(10)}
+    filesystem.save_files(files)
+    return files
+
+
+class TestConcurrentAccess:
+    """测试并发访问"""
+    
+    def test_save_files_bulk(self, filesystem, warm_files):
+        """测试批量保存：文件和注册表条目与逐个保存一致"""
+        assert set(filesystem.list_files()) == set(warm_files)
+        reg = filesystem._read_registry()
+        for name, content in warm_files.items():
+            assert filesystem.read_file(name)['content'] == content
+            assert reg[name]['size'] == len(content)
+
+    def test_concurrent_overwrites(self, filesystem, warm_files):
+        """测试并发覆盖已存在的文件，只考察写锁和注册表更新"""
+        def overwrite(name):
+            filesystem.save_file(name, f"{name} overwritten")
+        
+        # 消费 map 的结果，线程里的异常会在这里重新抛出
+        with ThreadPoolExecutor(max_workers=len(warm_files)) as ex:
+            list(ex.map(overwrite, warm_files))
+        
+        reg = filesystem._read_registry()
+        for name in warm_files:
+            assert filesystem.read_file(name)['content'] == f"{name} overwritten"
+            assert reg[name]['size'] == len(f"{name} overwritten")
+
+    def test_concurrent_writes(self, filesystem):
+        """测试并发写入"""
+        def write_file(file_id):
+            content = f"content from thread {file_id}"
+            filesystem.save_file(f'thread_{file_id}.txt', content)
+        
+        with ThreadPoolExecutor(max_workers=10) as ex:
+            list(ex.map(write_file, range(10)))
+        
+        files = filesystem.list_files()
+        assert len(files) == 10
+        assert set(files) == {f'thread_{i}.txt' for i in range(10)}
+
+    def test_concurrent_reads(self, filesystem):
+        """测试并发读取"""
+        filesystem.save_file('shared.txt', 'shared content')
+        
+        def read_file(_):
+            return filesystem.read_file('shared.txt')['content']
+        
+        with ThreadPoolExecutor(max_workers=10) as ex:
+            results = list(ex.map(read_file, range(10)))
+        
+        assert len(results) == 10
+        assert all(content == 'shared content' for content in results)
+
+
+class TestSpecialCases:
+    """测试特殊情况"""
+    
+    def test_special_characters_in_filename(self, filesystem):
+        """测试特殊字符文件名"""
+        filename = 'test-file_name@2024.txt'
+        filesystem.save_file(filename, 'content')
+        
+        files = filesystem.list_files()
+        assert filename in files
+
+    def test_nested_directory_creation(self, filesystem):
+        """测试嵌套目录创建"""
+        nested_path = 'level1/level2/level3/test.txt'
+        result = write_then_read(filesystem, nested_path, 'nested content')
+        assert result['content'] == 'nested content'
+
+    def test_file_overwrite(self, filesystem):
+        """测试文件覆盖"""
+        filesystem.save_file('overwrite.txt', 'original')
+        result = write_then_read(filesystem, 'overwrite.txt', 'overwritten')
+        assert result['content'] == 'overwritten'
+
+
+class TestErrorHandling:
+    """测试错误处理"""
+    
+    def test_read_nonexistent_file(self, filesystem):
+        """测试读取不存在的文件"""
+        with pytest.raises(FileSystemError):
+            filesystem.read_file('nonexistent.txt')
+
+    def test_edit_unsupported_file_type(self, filesystem):
+        """测试编辑不支持的文件类型"""
+        filesystem.save_file('test.xyz', 'content')
+        with pytest.raises(FileSystemError):
+            filesystem.edit_file('test.xyz', _BAD_PATCH)
+
+    def test_invalid_patch_format(self, filesystem):
+        """测试无效的补丁格式"""
+        filesystem.save_file('test.txt', 'content')
+        with pytest.raises(FileSystemError):
+            filesystem.edit_file('test.txt', _BAD_PATCH)
+
+
+@pytest.mark.xdist_group("api")
+class TestAPI:
+    """测试API功能（不涉及文件读写，并行运行时集中到同一个进程）"""
+    
+    def test_describe_api(self):
+        """测试API描述功能"""
+        description = FileSystem.describe_api()
+        assert 'FileSystem API' in description
+        assert 'list_files' in description
+        assert 'read_file' in description
+        assert 'save_file' in description
+        assert 'delete_file' in description
+        assert 'edit_file' in description
+
+    def test_describe_specific_methods(self):
+        """测试特定方法的API描述"""
+        description = FileSystem.describe_api(['save_file', 'read_file'])
+        assert 'save_file' in description
+        assert 'read_file' in description
+        assert 'delete_file' not in description
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
\ No newline at end of file